@@ -0,0 +1,102 @@
+# Time sliced AI scheduler for enemies
+#  - movement and health (update_enemy, update) still run for every enemy every step
+#  - each enemy type only runs the behaviours it owns (no per method type checks for every enemy)
+#  - perception (is the player in the detection zone) is cached per enemy and refreshed every N steps,
+#    N grows with the number of enemies (level of detail) and enemies are staggered over the N steps
+#  - the schedule only depends on the step count and spawn order, so replays stay exact
+
+
+# ___ behaviours: (enemy, ctx, in_sight) ___
+def _laser(enemy, ctx, in_sight):
+    enemy.ai_shoot(ctx, in_sight=in_sight)
+
+
+def _heavy(enemy, ctx, in_sight):
+    enemy.ai_shoot_heavy(ctx, in_sight=in_sight)
+
+
+def _rocket(enemy, ctx, in_sight):
+    enemy.ai_shoot_rocket(ctx, in_sight=in_sight)
+
+
+def _laserline(enemy, ctx, in_sight):
+    enemy.ai_shoot_laserline(ctx, in_sight=in_sight)
+
+
+def _battleship(enemy, ctx, in_sight):
+    enemy.ai_shoot_enemy5(ctx, in_sight=in_sight)
+
+
+def _plasma(enemy, ctx, in_sight):
+    enemy.ai_shoot_plasma(ctx, in_sight=in_sight)
+
+
+def _power_battleship(enemy, ctx, in_sight):
+    enemy.ai_enemy7_shoot(ctx, in_sight=in_sight)
+
+
+BEHAVIOURS = {
+    'enemy1': (_heavy,),
+    'enemy2': (_rocket,),
+    'enemy3': (_laser,),
+    'enemy4': (_laserline,),
+    'enemy5': (_battleship,),
+    'enemy6': (_plasma,),
+    'enemy7': (_power_battleship,),
+    'enemy8': (), # mothership only launches fighters (in its update)
+    'enemy9': (_laser,),
+}
+
+# (max enemies, perception interval in steps), more enemies -> less frequent checks
+LOD_TIERS = ((8, 1), (16, 2), (32, 3))
+MAX_INTERVAL = 4
+
+
+class AIScheduler:
+    def __init__(self):
+        self.reset()
+
+
+    def reset(self):
+        self.step = 0
+        self.next_slot = 0
+        self.perception_checks = 0
+
+
+    def interval(self, enemy_count):
+        for max_enemies, interval in LOD_TIERS:
+            if enemy_count <= max_enemies:
+                return interval
+        return MAX_INTERVAL
+
+
+    def update(self, ctx):
+        """Move every enemy and run the behaviours of its type"""
+        self.step += 1
+        player = ctx.player
+        interval = self.interval(len(ctx.enemies))
+
+        for enemy in ctx.enemies:
+            enemy.update_enemy(ctx)
+            enemy.update(ctx)
+
+            behaviours = BEHAVIOURS.get(enemy.character_type, ())
+            if not behaviours:
+                continue
+
+            if enemy.ai_slot is None: # first step, look right away
+                enemy.ai_slot = self.next_slot
+                self.next_slot += 1
+                enemy.player_in_sight = enemy.sees(player)
+                self.perception_checks += 1
+            elif (self.step + enemy.ai_slot) % interval == 0:
+                enemy.player_in_sight = enemy.sees(player)
+                self.perception_checks += 1
+
+            for behaviour in behaviours:
+                behaviour(enemy, ctx, enemy.player_in_sight)
+
+
+
+# scheduler shared by the play loop
+scheduler = AIScheduler()
@@ -0,0 +1,63 @@
+import pygame # type: ignore
+import os
+
+
+# Process wide surface cache
+#  - every entry is keyed by (path, size, flip) so a scaled/flipped variant is only built once
+#  - surfaces are converted on first load, so they must only be requested after the window exists
+#  - cached surfaces are shared, never draw onto them (copy first if you need to)
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+_surfaces = {}
+_stats = {'hits': 0, 'misses': 0}
+
+
+def _load(path, size, flip):
+    img = pygame.image.load(path).convert_alpha()
+    if size is not None:
+        img = pygame.transform.scale(img, size)
+    if flip[0] or flip[1]:
+        img = pygame.transform.flip(img, flip[0], flip[1])
+    return img
+
+
+def get_image(path, size=None, flip=(False, False)):
+    """Return a converted surface for one image file
+       - size: (w, h) to scale to or None to keep the file size
+       - flip: (flip_x, flip_y)
+    """
+    key = (path, size, flip)
+    img = _surfaces.get(key)
+    if img is None:
+        _stats['misses'] += 1
+        img = _load(path, size, flip)
+        _surfaces[key] = img
+    else:
+        _stats['hits'] += 1
+    return img
+
+
+def get_frames(folder, size=None, flip=(False, False)):
+    """Return a tuple of converted surfaces for every image in a folder (sorted by filename)"""
+    key = (folder, size, flip)
+    frames = _surfaces.get(key)
+    if frames is None:
+        _stats['misses'] += 1
+        files = sorted(f for f in os.listdir(folder) if f.lower().endswith(IMAGE_EXTENSIONS))
+        frames = tuple(_load(os.path.join(folder, f), size, flip) for f in files)
+        _surfaces[key] = frames
+    else:
+        _stats['hits'] += 1
+    return frames
+
+
+def cache_info():
+    """Hit/miss counters and number of cached entries (for debugging and profiling)"""
+    return {'hits': _stats['hits'], 'misses': _stats['misses'], 'entries': len(_surfaces)}
+
+
+def clear():
+    _surfaces.clear()
+    _stats['hits'] = 0
+    _stats['misses'] = 0
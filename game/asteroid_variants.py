@@ -0,0 +1,57 @@
+import os
+import pygame # type: ignore
+
+import asset_cache
+
+
+# Asteroid variant index
+#  - the image files of every asteroid family (rock, ice, junk) are listed once
+#  - every variant is scaled once per pyramid level, a split picks an already scaled surface
+#  - spawning or splitting an asteroid does no filesystem, decode or scale work
+#  - scales outside the pyramid still work, they are scaled once and kept in the asset cache
+
+FAMILY_FOLDERS = {
+    'rock': "img/asteroids",
+    'ice': "img/ice",
+    'junk': "img/spaceJunk",
+}
+PYRAMID = (1.0, 0.5, 0.25, 0.125) # spawn scale and every scale a split can reach (smaller pieces are killed)
+MISSING_SIZE = (100, 100)
+
+_index = {} # family -> tuple of image paths
+
+
+def family_for(ice, junk):
+    # junk wins over ice, same order as the asteroid folder pick
+    return 'junk' if junk else 'ice' if ice else 'rock'
+
+
+def _scaled(path, scale):
+    raw = asset_cache.get_image(path)
+    return asset_cache.get_image(path, size=(int(raw.get_width() * scale), int(raw.get_height() * scale)))
+
+
+def preload():
+    """List every family and build its scale pyramid (needs the display, call once a level starts)"""
+    for family, folder in FAMILY_FOLDERS.items():
+        if family in _index:
+            continue
+        files = sorted(f for f in os.listdir(folder) if f.lower().endswith(asset_cache.IMAGE_EXTENSIONS)) if os.path.isdir(folder) else []
+        _index[family] = tuple(os.path.join(folder, f) for f in files)
+        for path in _index[family]:
+            for scale in PYRAMID:
+                _scaled(path, scale)
+
+
+def variant_count(family):
+    if family not in _index:
+        preload()
+    return len(_index[family])
+
+
+def get_surface(family, variant, scale):
+    """Surface for one variant at one scale (shared, never draw onto it)"""
+    paths = _index[family]
+    if not paths:
+        return pygame.Surface((int(MISSING_SIZE[0] * scale), int(MISSING_SIZE[1] * scale)), pygame.SRCALPHA)
+    return _scaled(paths[variant], scale)
@@ -0,0 +1,28 @@
+import config
+from level_config import get_level_config, load_background_images
+from scrolling_background import ScrollingBackground
+
+
+# Memoized level backgrounds
+#  - keyed by (level number, play field render size) so a render scale change never reuses wrong sized images
+#  - transition, play and death screens all share the same scrolling background
+#  - retain() evicts the levels that are no longer in use to free the full screen surfaces
+
+_backgrounds = {}
+
+
+def get_background(level_number):
+    """Return the scrolling background of a level, loading it only on first use"""
+    key = (level_number, config.internal_surface.get_size())
+    background = _backgrounds.get(key)
+    if background is None:
+        background = ScrollingBackground(load_background_images(get_level_config(level_number)))
+        _backgrounds[key] = background
+    return background
+
+
+def retain(*level_numbers):
+    """Evict every cached level that is not listed"""
+    for key in list(_backgrounds):
+        if key[0] not in level_numbers:
+            del _backgrounds[key]
@@ -0,0 +1,227 @@
+"""Scenario benchmarks
+   - every scenario is a seeded headless run of start_game with a fixed input script, so runs are comparable
+   - each scenario runs twice: simulation only (headless) and simulation plus drawing (rendered, offscreen window)
+   - reports p50/p95/p99 frame time, peak entity counts, peak blits per render layer, heap growth per frame, gc pauses, object pool high water marks and asset cache hits as JSON
+   - a scenario lists the entities it is meant to exercise, the report names any that never showed up
+   - the player can not die (damage is undone, black holes do not kill), a run that still ends early is reported as an error
+
+   run from the repository root:
+   python game/benchmark.py --out bench.json
+   python game/benchmark.py --scenario all_weapons --frames 600
+"""
+import os, sys, json, time, argparse, subprocess, contextlib
+
+os.environ['MUSH_HEADLESS'] = '1' # must be set before config is imported
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1' # keep stdout pure JSON
+
+import pygame # type: ignore
+
+import config
+import main
+import asset_cache
+import headless
+import level_config
+import object_pool
+import spawn_budget
+import blackhole_frames
+import gc_policy
+from render_queue import render_queue
+from entity_registry import registry
+from spaceObjects import Asteroid, BlackHole
+from sprite_groups import asteroid_group, blackholes_group, enemy_group
+
+
+SEED = 1
+FRAMES = 1200 # 20 seconds of game time per scenario and mode
+WARMUP_FRAMES = 30 # first frames load and convert assets, not counted in the percentiles
+
+
+# ___ scenario setups: called with the player once the level is built ___
+def setup_black_holes(player):
+    for x in (config.SCREEN_WIDTH * 0.25, config.SCREEN_WIDTH * 0.5, config.SCREEN_WIDTH * 0.75):
+        bh = BlackHole(int(x), config.SCREEN_HEIGHT // 4)
+        # slow straight drift so all three stay on screen for the whole run
+        bh.velocity_x = 0.0
+        bh.velocity_y = 0.25
+        blackholes_group.add(bh)
+
+
+def setup_asteroid_storm(player):
+    columns = 12
+    for row in range(3):
+        for col in range(columns):
+            x = int((col + 0.5) * config.SCREEN_WIDTH / columns)
+            asteroid_group.add(Asteroid.acquire(x, 60 + row * 140, scale=1.0, health=20))
+
+
+def script_rockets(step):
+    going_left = (step // 120) % 2 == 0
+    return {'rocket': True, 'shooting': True, 'moving_left': going_left, 'moving_right': not going_left}
+
+
+ALL_WEAPONS = {weapon: True for weapon in level_config.LEVELS[2]['weapons']}
+
+# expect: entity counts or enemy types that must be seen during the run (a scenario that never reaches its subject is reported)
+# weapons: weapon table used instead of the level's own for the run (no level enables every weapon)
+SCENARIOS = {
+    'level2_wave20':     {'level': 2, 'start_wave': 20, 'script': headless.script_strafe, 'expect': ('enemy_group',)},
+    'mothership_wave5':  {'level': 2, 'start_wave': 5, 'script': headless.script_strafe, 'expect': ('enemy8', 'enemy9')},
+    'three_black_holes': {'level': 2, 'setup': setup_black_holes, 'script': headless.script_strafe, 'expect': ('blackholes_group',)},
+    'asteroid_storm':    {'level': 2, 'setup': setup_asteroid_storm, 'script': script_rockets, 'expect': ('asteroid_group', 'rockets')},
+    'all_weapons':       {'level': 2, 'weapons': ALL_WEAPONS, 'script': headless.script_fire_all,
+                          'expect': ('player_laser', 'player_heavy', 'rockets', 'plasma', 'ice_bullets')},
+}
+
+
+def percentiles(samples):
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+    return {
+        'p50': round(pick(0.50), 3),
+        'p95': round(pick(0.95), 3),
+        'p99': round(pick(0.99), 3),
+        'mean': round(sum(ordered) / len(ordered), 3),
+        'max': round(ordered[-1], 3),
+    }
+
+
+@contextlib.contextmanager
+def weapons_override(level, weapons):
+    level_settings = level_config.get_level_config(level)
+    saved = level_settings['weapons']
+    if weapons is not None:
+        level_settings['weapons'] = weapons
+    try:
+        yield
+    finally:
+        level_settings['weapons'] = saved
+
+
+@contextlib.contextmanager
+def player_immortal():
+    """Falling into a black hole does not end the run (damage is undone by the measured script every step)"""
+    BlackHole.KILLS_PLAYER = False
+    try:
+        yield
+    finally:
+        BlackHole.KILLS_PLAYER = True
+
+
+def run_scenario(name, render, frames=FRAMES):
+    """Run one scenario and measure every loop iteration (one simulation step, plus drawing when rendered)"""
+    scenario = SCENARIOS[name]
+    input_script = scenario['script']
+    extra_setup = scenario.get('setup')
+    frame_ms = []
+    blocks = []
+    peak = {}
+    peak_blits = {}
+    seen_types = set()
+    last = {'time': None, 'blocks': 0}
+    state = {'player': None, 'steps': 0}
+
+    def setup(player):
+        state['player'] = player
+        if extra_setup is not None:
+            extra_setup(player)
+
+    def measured_script(step):
+        # called at the start of every step, so the time since the last call is one full loop iteration
+        now = time.perf_counter()
+        allocated = sys.getallocatedblocks()
+        if last['time'] is not None and step > WARMUP_FRAMES:
+            frame_ms.append((now - last['time']) * 1000)
+            blocks.append(allocated - last['blocks'])
+        last['time'] = now
+        last['blocks'] = allocated
+        state['steps'] = step + 1
+
+        for key, count in main.entity_counts().items():
+            if count > peak.get(key, 0):
+                peak[key] = count
+        seen_types.update(t for t, sprites in registry.by_type.get(enemy_group, {}).items() if sprites)
+        if render: # blits per layer of the frame drawn at the end of the last step
+            for layer, count in render_queue.counts().items():
+                if count > peak_blits.get(layer, 0):
+                    peak_blits[layer] = count
+
+        # the player can not die, every scenario runs its full length
+        player = state['player']
+        player.health = player.max_health
+        return input_script(step)
+
+    result = {'render': render, 'frames': frames}
+    gc_policy.clear_pauses()
+    start = time.perf_counter()
+    try:
+        with weapons_override(scenario['level'], scenario.get('weapons')), player_immortal():
+            result['result'] = main.start_game(scenario['level'], max_steps=frames, input_script=measured_script,
+                                               render=render, seed=SEED, start_wave=scenario.get('start_wave', 1),
+                                               setup=setup)
+    except Exception as e: # report a broken scenario and keep running the others
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    result['steps'] = state['steps']
+    if 'error' not in result and (result.get('result') != 'menu' or state['steps'] < frames):
+        # a run that ended early measured fewer frames than asked, its timings are not comparable
+        result['error'] = f"truncated: {result.get('result')} after {state['steps']} of {frames} steps"
+    result['frame_ms'] = percentiles(frame_ms)
+    # net change of live allocator blocks per frame: heap growth, not an allocation count
+    # (CPython has no allocation counter, blocks allocated and freed within one frame cancel out)
+    result['heap_growth_blocks_per_frame'] = percentiles(blocks)
+    result['peak_entities'] = peak
+    missing = [key for key in scenario.get('expect', ()) if not peak.get(key) and key not in seen_types]
+    if missing:
+        result['missing'] = missing
+    if render:
+        result['peak_blits'] = peak_blits
+    result['gc_pauses'] = {f'gen{generation}': {'count': p['count'], 'mean_ms': round(p['mean_ms'], 3), 'max_ms': round(p['max_ms'], 3)}
+                           for generation, p in sorted(gc_policy.pause_stats().items())}
+    result['spawn_denied'] = {category: s['denied'] for category, s in spawn_budget.stats().items()}
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(names=None, frames=FRAMES, modes=('headless', 'rendered')):
+    report = {
+        'commit': git_commit(),
+        'python': sys.version.split()[0],
+        'pygame': pygame.version.ver,
+        'screen': [config.SCREEN_WIDTH, config.SCREEN_HEIGHT],
+        'render_scale': config.RENDER_SCALE,
+        'play_field': [config.INTERNAL_WIDTH, config.INTERNAL_HEIGHT],
+        'seed': SEED,
+        'scenarios': {},
+    }
+    for name in names or SCENARIOS:
+        report['scenarios'][name] = {mode: run_scenario(name, mode == 'rendered', frames) for mode in modes}
+    report['pools'] = object_pool.stats() # high water marks over the whole run
+    report['blackhole_rotations'] = blackhole_frames.stats()
+    report['asset_cache'] = asset_cache.cache_info() # every miss is one image load and transform, hits are shared surfaces
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the benchmark scenarios and print a JSON report")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help="run only this scenario (repeatable)")
+    parser.add_argument('--frames', type=int, default=FRAMES)
+    parser.add_argument('--mode', choices=('headless', 'rendered'), help="run only one mode")
+    parser.add_argument('--out', metavar='PATH', help="write the report to a file instead of stdout")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(sys.stderr): # game prints stay out of the report
+        report = run(args.scenario, args.frames, (args.mode,) if args.mode else ('headless', 'rendered'))
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
@@ -0,0 +1,90 @@
+import os
+import pygame # type: ignore
+
+import asset_cache
+
+
+# Shared black hole and quark star frames
+#  - the animation frames of each kind are loaded and scaled once (asset cache), not on every spawn
+#  - every frame is pre-rotated to every ANGLE_STEP, one fixed table per (kind, size) shared by all instances,
+#    so rotating a black hole is an index into the table and never a transform
+#  - every black hole spawns at angle 0 and turns slowly, a table only covers the angles it reaches while on screen
+#    (BlackHole.visible_angle), past the end of the table the last angle is kept (the black hole is below the screen)
+#  - tables are built at level load (prebuild), a black hole never builds one mid play on a level that has them
+#  - 2 degree steps (a new angle every ~13 steps at 0.15 degrees per step) over ~195 degrees are ~1180 rotations,
+#    ~185 MB for both kinds at 1080p; the full circle would be ~340 MB
+
+ANGLE_STEP = 2
+ANGLE_STEPS = 360 // ANGLE_STEP
+DEFAULT_SIZE = 160 # every black hole in the game is spawned at this size
+
+FOLDERS = {
+    'blackhole': "img/blackhole",
+    'quarkstar': "img/quarkstar",
+}
+FALLBACK_IMAGE = "img/blackhole/0.png"
+
+_frames = {} # (kind, size) -> tuple of frames
+_tables = {} # (kind, size) -> per frame tuple of rotated surfaces, one per angle step
+_stats = {'builds': 0}
+
+
+def get_frames(kind, size):
+    """Animation frames of one kind scaled to size x size (shared, never draw onto them)"""
+    key = (kind, size)
+    frames = _frames.get(key)
+    if frames is None:
+        folder = FOLDERS[kind]
+        paths = []
+        if os.path.isdir(folder):
+            paths = [os.path.join(folder, f) for f in sorted(os.listdir(folder)) if f.lower().endswith(asset_cache.IMAGE_EXTENSIONS)]
+        if not paths and os.path.exists(FALLBACK_IMAGE):
+            paths = [FALLBACK_IMAGE]
+        frames = tuple(asset_cache.get_image(path, size=(size, size)) for path in paths)
+        if not frames: # nothing to load, draw nothing
+            frames = (pygame.Surface((size, size), pygame.SRCALPHA),)
+        _frames[key] = frames
+    return frames
+
+
+def angle_step(angle):
+    return int(round(angle / ANGLE_STEP)) % ANGLE_STEPS
+
+
+def get_table(kind, size, max_angle=360):
+    """Every frame of one kind at every angle step from 0 to max_angle (a table is extended when a wider range is asked)"""
+    key = (kind, size)
+    steps = min(ANGLE_STEPS, int(max_angle // ANGLE_STEP) + 2) # angle_step rounds up to half a step past max_angle
+    table = _tables.get(key)
+    built = 0 if table is None else len(table[0])
+    if built < steps:
+        frames = get_frames(kind, size)
+        table = _tables[key] = tuple(
+            (table[i] if table else ()) + tuple(pygame.transform.rotate(frame, step * ANGLE_STEP) for step in range(built, steps))
+            for i, frame in enumerate(frames))
+        _stats['builds'] += 1
+    return table
+
+
+def prebuild(max_angle, size=DEFAULT_SIZE):
+    """Build the tables of every kind up to max_angle, call while a level loads"""
+    for kind in FOLDERS:
+        get_table(kind, size, max_angle)
+
+
+def get_rotated(kind, size, frame_index, angle):
+    """One frame rotated to the nearest ANGLE_STEP (the last angle of the table past its end)"""
+    table = _tables.get((kind, size)) or get_table(kind, size)
+    rotations = table[frame_index]
+    return rotations[min(angle_step(angle), len(rotations) - 1)]
+
+
+def stats():
+    tables = [rotations for table in _tables.values() for rotations in table]
+    return {
+        'tables': len(_tables),
+        'rotations': sum(len(rotations) for rotations in tables),
+        'max_angle': max((len(rotations) - 1) * ANGLE_STEP for rotations in tables) if tables else 0,
+        'megabytes': round(sum(s.get_width() * s.get_height() * s.get_bytesize() for rotations in tables for s in rotations) / 2**20, 1),
+        'builds': _stats['builds'],
+    }
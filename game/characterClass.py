@@ -1,21 +1,48 @@
 import pygame # type: ignore
-import random
 
 import config
-from projectiles import Laser, Rocket
+import sim_clock
+import rng
+import character_registry
+from object_pool import Pooled
+import spawn_budget
+from projectiles import Rocket
+from laser_engine import lasers as laser_engine
 from sprite_groups import explosion_group, enemy_group
+from entity_registry import registry
+
+# detection zone per enemy type, built from the enemy rect (enemies look down the screen)
+DETECTION_ZONES = {
+    'enemy1': lambda r: pygame.Rect(r.centerx - 25, r.bottom, 40, 720),
+    'enemy2': lambda r: pygame.Rect(r.centerx - 25, r.bottom, 50, 760),
+    'enemy3': lambda r: pygame.Rect(r.centerx - 25, r.bottom, 30, 700),
+    'enemy4': lambda r: pygame.Rect(r.centerx - 50, r.bottom, 100, 730),
+    'enemy5': lambda r: pygame.Rect(r.left - 100, r.top, r.width + 100, 700),
+    'enemy6': lambda r: pygame.Rect(r.centerx - 50, r.bottom, 100, 690),
+    'enemy7': lambda r: pygame.Rect(r.centerx - 75, r.bottom - 50, 150, 800),
+    'enemy9': lambda r: pygame.Rect(r.centerx - 25, r.bottom, 30, 700),
+}
+
 
 # create base character class
 class Character(pygame.sprite.Sprite):
     def __init__(self, character_type, character_x, character_y, scale, velocity):
         pygame.sprite.Sprite.__init__(self)
+        self.reset_state(character_type, character_x, character_y, scale, velocity)
+
+
+    # assign every per life attribute (pooled subclasses call this from reset(), group membership is kept)
+    def reset_state(self, character_type, character_x, character_y, scale, velocity):
         self.character_type = character_type
         self.velocity = velocity
         self.flip = False # if needed to flip in x direction
         self.health = 100 # player and enemy health
         self.shield = 200
 
-        stats = config.character_stats.get(self.character_type, {'health': 100, 'shield': -1})
+        # frames, stats and rewards shared by every character of this type and scale
+        self.type_info = character_registry.get_type(character_type, scale)
+
+        stats = self.type_info.stats
         self.health = stats.get('health', 100)
         self.shield = stats.get('shield', -1)
 
@@ -24,21 +51,20 @@ class Character(pygame.sprite.Sprite):
         self.alive = True
         
         # for enemies
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = sim_clock.get_ticks()
         self.start_delay = 4000
         self.phase = 'enter'
         self.target_y = 50
         
-        # load object image
-        img = pygame.image.load(f'img/{self.character_type}/Idle/0.png').convert_alpha()
-        self.image = pygame.transform.scale(img, (int(img.get_width() * scale), int(img.get_height() * scale)))
+        # object image
+        self.image = self.type_info.idle
         self.rect = self.image.get_rect()
         self.rect.center = (character_x, character_y)
 
-        # laser shooting attributes
-        self.lasers = pygame.sprite.Group()
+        # laser shooting attributes (shots live in the shared laser engine)
         self.laser_cooldown = 100 # milliseconds
         self.laser_shot_time = 0
+        self.last_shot_time = 0
 
         # heavy lasers
         self.heavy_cooldown = 300
@@ -48,30 +74,21 @@ class Character(pygame.sprite.Sprite):
         self.prev_health = self.health
         self.flash_time = 100 # in ms
         self.flash_start = 0
-        self.original_image = self.image.copy()
+        self.original_image = self.image
+
+        # black hole warp of the last step as (sim time, size), applied when drawn so damage_flash can not undo it
+        self.warp = None
 
         # shield hit
         self.prev_shield = self.shield
         self.shield_time = 100 # ms / total shield duration in (ms per frame)
         self.shield_start = 0
-        self.shield_original_image = self.image.copy()
-
-        # ___ load flash images  ___
-        self.flash_images = []
-        for i in range(2): # flash 2 images in folder
-            img = pygame.image.load(f'img/{self.character_type}/damage/{i}.png').convert_alpha()
-            img = pygame.transform.scale(img, (self.rect.width, self.rect.height))
-            self.flash_images.append(img)
-            
-        self.flash_index = 0
+        self.shield_original_image = self.image
 
-        # ___ load shield images ___
-        self.shield_images = []
-        for i in range(2): # 2 pictures to loop
-            img = pygame.image.load(f'img/{self.character_type}/shield/{i}.png').convert_alpha()
-            img = pygame.transform.scale(img, (self.rect.width, self.rect.height))
-            self.shield_images.append(img)
-        
+        # ___ flash and shield images (shared) ___
+        self.flash_images = self.type_info.flash_images
+        self.flash_index = 0
+        self.shield_images = self.type_info.shield_images
         self.shield_index = 0
 
         # rockets
@@ -90,42 +107,29 @@ class Character(pygame.sprite.Sprite):
         self.frozen_until = 0
         self.is_frozen = False
 
+        # ai scheduler state (perception slot and the last detection result)
+        self.ai_slot = None
+        self.player_in_sight = False
 
-    # create custom draw method for characters
-    def draw(self):
-        img = self.image.copy()
-
-        # frozen visual effect
-        if self.character_type.startswith("enemy") and self.is_frozen:
-            # create transparent layer same size as enemy image
-            freeze_overlay = pygame.Surface(img.get_size(), pygame.SRCALPHA)
-            
-            mask = pygame.mask.from_surface(img)
-            ice_surface = mask.to_surface(
-                setcolor=(120, 200, 255, 80),
-                unsetcolor=(0, 0, 0, 0)
-            )
-            
-            # overlay ice layer
-            img.blit(ice_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            
-            outline = mask.outline()
-            for i, point in enumerate(outline):
-                if i % 2 == 0:
-                    pygame.draw.circle(img, (180, 240, 255, 150), point, 1)
 
-        config.game_window.blit(pygame.transform.flip(img, self.flip, False), self.rect)
+    # image as shown on screen
+    def frame_image(self):
+        # flipped and frozen versions of every frame are cached per type (frozen is only set for enemies)
+        image = self.type_info.variant(self.image, self.flip, self.is_frozen)
+        # shrunk by a black hole in the latest step (the rect already has the shrunk size)
+        if self.warp is not None and self.warp[0] == sim_clock.get_ticks():
+            image = pygame.transform.smoothscale(image, self.warp[1])
+        return image
 
         
     # update character class objects
-    def update(self, player):
-        self.check_alive(player)
-        self.damage_flash()  
+    def update(self, ctx):
+        self.check_alive(ctx.player)
+        self.damage_flash(ctx.now)
 
         # only enemies can be frozen
         if self.character_type.startswith("enemy"):
-            now = pygame.time.get_ticks()
-            if now < self.frozen_until:
+            if ctx.now < self.frozen_until:
                 self.is_frozen = True
             else:
                 self.is_frozen = False
@@ -141,7 +145,7 @@ class Character(pygame.sprite.Sprite):
                 self.kill()
 
                 # trigger explosion of dead enemy ship
-                explosion = Explosion(self.rect.center, explosion_frames, frame_duration=80)
+                explosion = Explosion.acquire(self.rect.center, explosion_frames, frame_duration=80)
                 explosion_group.add(explosion)
 
                 config.channel_10.set_volume(1)
@@ -149,7 +153,7 @@ class Character(pygame.sprite.Sprite):
 
                 # only give rewards if this is an enemy (not the player)
                 if self.character_type.startswith("enemy"):
-                    reward = config.enemy_rewards.get(self.character_type, {'score': 70, 'shield': 30, 'health':0})
+                    reward = self.type_info.reward
                     config.score += reward['score']
                     
                     # bonuses
@@ -162,25 +166,25 @@ class Character(pygame.sprite.Sprite):
 
 
     # flash damage when hit
-    def damage_flash(self):
+    def damage_flash(self, now):
         # check if currently flashing
-        elapsed = pygame.time.get_ticks() - self.flash_start
+        elapsed = now - self.flash_start
         flashing = elapsed < self.flash_time * len(self.flash_images)
         
         # only restart flash if health decreased and not already flashing
         if self.health < self.prev_health and not flashing:
-            self.flash_start = pygame.time.get_ticks()
+            self.flash_start = now
             
         self.prev_health = self.health # check for new health as this one to be compared for damage
 
         # __ shield falshing __
-        elapsed_shield = pygame.time.get_ticks() - self.shield_start
+        elapsed_shield = now - self.shield_start
         shield_flashing = elapsed_shield < self.shield_time * len(self.shield_images)
         
         if self.shield < self.prev_shield and not shield_flashing:
             config.channel_9.set_volume(0.6)
             config.channel_9.play(config.shield_fx)
-            self.shield_start = pygame.time.get_ticks()
+            self.shield_start = now
         self.prev_shield = self.shield
         
         # Hanlde flashing/shield animation
@@ -242,9 +246,15 @@ class Character(pygame.sprite.Sprite):
 
 
     # AI enemies 
-    def update_enemy(self, window_height):
+    def sees(self, player):
+        """Player inside this type's detection zone"""
+        zone = DETECTION_ZONES.get(self.character_type)
+        return zone is not None and zone(self.rect).colliderect(player.rect)
+
+
+    def update_enemy(self, ctx):
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             return
 
         if self.phase == "enter":
@@ -252,109 +262,67 @@ class Character(pygame.sprite.Sprite):
                 self.rect.y += self.velocity
             else:
                 self.phase = "hold"
-                self.spawn_time = pygame.time.get_ticks()
+                self.spawn_time = ctx.now
                 
         elif self.phase == "hold":
-            if pygame.time.get_ticks() - self.spawn_time >= self.start_delay:
+            if ctx.now - self.spawn_time >= self.start_delay:
                 self.phase = "move"
                 
         elif self.phase == "move":
             self.rect.y += self.velocity
-            if self.rect.top > window_height:
+            if self.rect.top > config.SCREEN_HEIGHT:
                 self.kill()
                 
                 
     ##### basic laser #####
 
     # laser shoot check method for player and enemy
-    def shoot_laser(self, target_player=None, target_enemy_group=None, asteroid_group=None):
-
-        if  asteroid_group is None:
-            return
-        
-        current_time = pygame.time.get_ticks() # get time
+    def shoot_laser(self, ctx):
+        current_time = ctx.now # get time
         if current_time - self.laser_shot_time >= self.laser_cooldown:
-            if self.character_type.startswith("enemy"):
-                if target_player is None:
-                    return
-                laser = Laser(self, target_player, target_enemy_group, asteroid_group)
-            else:
-                if target_enemy_group is None:
-                    return
-                laser = Laser(self, target_player, target_enemy_group, asteroid_group)
-                
-            self.lasers.add(laser)
+            laser_engine.fire(self)
             self.laser_shot_time = current_time
 
             config.laser_fx.play()
 
 
     # ai check for collision of vision
-    def ai_shoot(self, player, enemy_group, asteroid_group):
-        """Only enemy 3 and enemy 9 can shoot this laser"""
+    def ai_shoot(self, ctx, in_sight=None):
+        """Only enemy 3 and enemy 9 can shoot this laser
+           - in_sight: cached detection result from the ai scheduler (checked here when None)
+        """
         
         if self.character_type not in ("enemy3", "enemy9"):
             return # only ai3 and ai9 shoots
+        player = ctx.player
         
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             return  # cannot shoot while frozen
         
-        # create a detection rect
-        detection_rect = pygame.Rect(
-            self.rect.centerx - 25, # offset x by 25 px to top
-            self.rect.bottom,      # just below enemy / they are looking down from top screen
-            30,                    # width of rect
-            700                    # height
-            
-        )    
+        if in_sight is None:
+            in_sight = self.sees(player)
         # if player is inside detection rect zone
-        if detection_rect.colliderect(player.rect): # check detection rect and player rect overlapping
+        if in_sight:
             # temporarily override cooldown (3 times slower than player)
             original_cooldown = self.laser_cooldown
             self.laser_cooldown = original_cooldown * 3
             
             # Shoot
-            self.shoot_laser(
-                target_player=player,
-                target_enemy_group=enemy_group,
-                asteroid_group=asteroid_group
-            )
+            self.shoot_laser(ctx)
             
             # Restore original cooldown
             self.laser_cooldown = original_cooldown
 
 
-    # update lasers fired by characters
-    def update_lasers(self):
-        for laser in self.lasers:
-            laser.update()
-            laser.draw()
-
-
     # ____ Heavy laser ____
-    def shoot_heavy(self, target_player=None, target_enemy_group=None, asteroid_group=None):
-        from projectiles import HeavyLaser
-
-        if target_enemy_group is None or asteroid_group is None:
-            return
-         
-        now = pygame.time.get_ticks()
+    def shoot_heavy(self, ctx):
+        now = ctx.now
         if now - getattr(self, "last_heavy_shot", 0) < self.heavy_cooldown:
             return
         
         # create heavy laser
-        if self.character_type.startswith("enemy"):
-            # force enemy to get target or skip logic
-            if target_player is None:
-                return
-            heavy = HeavyLaser(self, target_player, target_enemy_group, asteroid_group)  
-        else: # player
-            if target_enemy_group is None: # if no target for player skip
-                return 
-            heavy = HeavyLaser(self, target_player, target_enemy_group, asteroid_group)  
-            
-        self.lasers.add(heavy)
+        laser_engine.fire(self, heavy=True)
         self.last_heavy_shot = now
 
         config.channel_3.set_volume(0.3)
@@ -362,42 +330,34 @@ class Character(pygame.sprite.Sprite):
     
 
     # ai heavy shot
-    def ai_shoot_heavy(self, player, enemy_group, asteroid_group):
+    def ai_shoot_heavy(self, ctx, in_sight=None):
         
         if self.character_type != "enemy1":
             return
+        player = ctx.player
         
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             return  # cannot shoot while frozen
         
         
-        detection_rect = pygame.Rect(
-            self.rect.centerx - 25, # offset x by 25 px to left so we center based on our picture 
-            self.rect.bottom,      # just below enemy / they are looking down from top screen
-            40,                    # width of rect
-            720                    # height
-            
-        )  
-        if not detection_rect.colliderect(player.rect): # if we do not collide with player we skip
+        if in_sight is None:
+            in_sight = self.sees(player)
+        if not in_sight: # if player is not in the detection zone we skip
             return
         
-        now = pygame.time.get_ticks()
+        now = ctx.now
         cooldown = 700
         
         if now - getattr(self, "last_heavy_shot", 0) >= cooldown:
             # call shared heavy shooting method
-            self.shoot_heavy(
-                target_player=player,
-                target_enemy_group=enemy_group,
-                asteroid_group=asteroid_group
-                )    
+            self.shoot_heavy(ctx)
             self.last_heavy_shot = now
 
 
     # rocket check
-    def shoot_rocket(self, target_group, rocket_group, asteroid_group):
-        current_time = pygame.time.get_ticks()
+    def shoot_rocket(self, ctx, target_group):
+        current_time = ctx.now
         
         # Enemy shoots at 1/3 the speed
         cooldown = self.rocket_cooldown
@@ -405,34 +365,30 @@ class Character(pygame.sprite.Sprite):
             cooldown *= 3
             
         if current_time - self.last_rocket_time >= cooldown:
-            rocket = Rocket(self, target_group, asteroid_group)
-            rocket_group.add(rocket)
+            rocket = Rocket.acquire(self, target_group, ctx.asteroids)
+            ctx.rockets.add(rocket)
             self.last_rocket_time = current_time
 
             config.channel_4.play(config.rockets_fx)
 
 
     # ai shoots
-    def ai_shoot_rocket(self, player, rocket_group, asteroid_group):
+    def ai_shoot_rocket(self, ctx, in_sight=None):
         """Only enemy 2 can shoot rockets"""
         if self.character_type not in "enemy2":
             return
+        player = ctx.player
         
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             return  # cannot shoot while frozen
         
-        # detection area rectangle
-        detection_rect = pygame.Rect(
-            self.rect.centerx - 25, # check image and center in x  -25px (left)
-            self.rect.bottom,
-            50,
-            760
-        )            
+        if in_sight is None:
+            in_sight = self.sees(player)
 
         # fire only if player is in detection range 
-        if detection_rect.colliderect(player.rect):
-            current_time = pygame.time.get_ticks()
+        if in_sight:
+            current_time = ctx.now
             
             # diffrent cooldown types
             if self.character_type == "enemy2":
@@ -441,51 +397,37 @@ class Character(pygame.sprite.Sprite):
                 rocket_cooldown = 2000 # 2 sec  
                 
             if current_time - getattr(self, "last_rocket_time", 0) >= rocket_cooldown:
-                self.shoot_rocket(
-                    pygame.sprite.Group([player]),
-                    rocket_group,
-                    asteroid_group
-                )
+                self.shoot_rocket(ctx, pygame.sprite.Group([player]))
                 self.last_rocket_time = current_time
 
 
-    def ai_shoot_enemy5(self, player, enemy_group, asteroid_group):
-        from projectiles import HeavyLaser
-        
+    def ai_shoot_enemy5(self, ctx, in_sight=None):
         # if not enemy 5 skip
         if self.character_type != "enemy5":
             return
+        player, enemy_group, asteroid_group = ctx.player, ctx.enemies, ctx.asteroids
         
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             return  # cannot shoot while frozen
                 
         # give 1 second delay before firing
-        if pygame.time.get_ticks() - self.spawn_time < 1000:
+        if ctx.now - self.spawn_time < 1000:
             return
         
-        # detection rectangle
-        detection_rect = pygame.Rect(
-            self.rect.left -100,
-            self.rect.top,
-            self.rect.width + 100, # size of rect + 100px
-            700
-        )
-
-        if not detection_rect.colliderect(player.rect):
+        if in_sight is None:
+            in_sight = self.sees(player)
+        if not in_sight:
             return # if not colliding rect vision with player rect
         
-        now = pygame.time.get_ticks()
+        now = ctx.now
         
         # fire normal lasers
         if now - getattr(self, "last_shot_time", 0) >= self.laser_cooldown:
             left_pos = (self.rect.centerx - 10, self.rect.bottom - 25)
             right_pos = (self.rect.centerx + 10, self.rect.bottom - 25)
             for pos in [left_pos, right_pos]:
-                laser = Laser(self, player, enemy_group, asteroid_group)
-                laser.rect.midtop = pos
-                laser.prev_center = pygame.math.Vector2(laser.rect.center)
-                self.lasers.add(laser)
+                laser_engine.fire(self, pos=pos)
             self.last_shot_time = now # assign time to reset check to current time 
             config.laser_fx.play()
 
@@ -496,17 +438,14 @@ class Character(pygame.sprite.Sprite):
             top_left_pos = (self.rect.left + offset_x, self.rect.top + offset_y) 
             top_right_pos = (self.rect.right - offset_x, self.rect.top + offset_y)
             for pos in [top_left_pos, top_right_pos]:
-                heavy = HeavyLaser(self, player, enemy_group, asteroid_group)
-                heavy.rect.midtop = pos
-                heavy.prev_center = pygame.math.Vector2(heavy.rect.center)
-                self.lasers.add(heavy)
+                laser_engine.fire(self, heavy=True, pos=pos)
                 
             self.last_heavy_shot = now # reset time counter
             config.channel_3.play(config.heavyLaser_fx)
 
 
     # laser rapid fire for enemy method
-    def ai_shoot_laserline(self, player, asteroid_group=None, laserline_group=None, blackholes=None):
+    def ai_shoot_laserline(self, ctx, in_sight=None):
         from projectiles import LaserLine
         """ 
         Only create one laserline and keep updating those object
@@ -514,45 +453,34 @@ class Character(pygame.sprite.Sprite):
         # check if enemy object is enemy 4
         if self.character_type != "enemy4":
             return # skip logic if not enemy 4
+        player, laserline_group = ctx.player, ctx.beams
         
+        # this enemy's laser line (at most one, looked up in the entity registry)
+        existing_line = registry.owned_by(laserline_group, self) if laserline_group is not None else None
+
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             # stop firing if frozen
-            if laserline_group is not None:
-                for line in list(laserline_group):
-                    if getattr(line, "character", None) == self:
-                        line.trigger(False)
+            if existing_line is not None:
+                existing_line.trigger(False)
             return  # cannot shoot while frozen
         
         # Remove existing laser line if enemy is dead
         if not self.alive and laserline_group is not None: # if enemy has died and there is a laserline object so not of type None
-            for line in list(laserline_group):
-                if getattr(line, "character", None) == self:
-                    line.trigger(False)
-                    line.kill() # remove group
+            if existing_line is not None:
+                existing_line.trigger(False)
+                existing_line.kill() # remove group
                     
             # make sure sound stops when enemy is dead
             if config.channel_8.get_busy():
                 config.channel_8.stop()
             return
         
-        # detection area
-        detection_rect = pygame.Rect(
-            self.rect.centerx -50,
-            self.rect.bottom,
-            100,
-            730
-        )
+        if in_sight is None:
+            in_sight = self.sees(player)
         
         # if player is in detection rect zone so colliding
-        if detection_rect.colliderect(player.rect):
-            existing_line = None
-            if laserline_group is not None: # if laserLine group object is there 
-                for line in laserline_group:
-                    if getattr(line, "character", None) == self:
-                        existing_line = line
-                        break
-            
+        if in_sight:
             # create if one does not exists
             if existing_line is None:
                  enemy_line = LaserLine(self, is_player=False)
@@ -564,16 +492,15 @@ class Character(pygame.sprite.Sprite):
         
         else: # if player is not in the detection zone
             # stop firing
-            if laserline_group is not None:
-                for line in laserline_group:
-                    if getattr(line, "character", None) == self:
-                        line.trigger(False)
+            if existing_line is not None:
+                existing_line.trigger(False)
 
 
-    def shoot_plasma(self, target_group, asteroid_group, plasma_group):
+    def shoot_plasma(self, ctx):
+        """Player plasma, two bolts at the enemies"""
         from projectiles import Plasma
         
-        now = pygame.time.get_ticks() # track time
+        now = ctx.now # track time
         
         cooldown = self.plasma_cooldown
         
@@ -585,30 +512,30 @@ class Character(pygame.sprite.Sprite):
             offsets = [(-24, 14), (30, 26)]
             
             for x_off, y_off in offsets:
-                plasma = Plasma(self, target_group, asteroid_group)
+                plasma = Plasma.acquire(self, ctx.enemies, ctx.asteroids)
                 
                 # apply offset to projectiles
                 plasma.rect.centerx = center_x + x_off
                 plasma.rect.centery = center_y + y_off
                 
-                plasma_group.add(plasma)
+                ctx.plasma.add(plasma)
                 
             self.last_plasma_time = now # keep track of new time for next event
             config.channel_12.play(config.plasma_fx)
 
 
-    def shoot_ice(self, enemy_group, ice_bullets_list):
+    def shoot_ice(self, ctx):
         from projectiles import IceBullet
         
         if self.character_type.startswith("enemy"):
             return  # only player can shoot ice bullets
         
-        now = pygame.time.get_ticks()
+        now = ctx.now
         
         if now - self.last_ice_time >= self.ice_cooldown:
             # create ice bullet from player's top center
-            ice_bullet = IceBullet(self, enemy_group, damage=30, freeze_duration_ms=3000)
-            ice_bullets_list.append(ice_bullet)
+            ice_bullet = IceBullet.acquire(self, ctx.enemies, damage=30, freeze_duration_ms=3000)
+            ctx.ice.append(ice_bullet)
             
             self.last_ice_time = now
             
@@ -616,26 +543,22 @@ class Character(pygame.sprite.Sprite):
             config.channel_13.play(config.ice_shoot_fx)
             
             
-    def ai_shoot_plasma(self, player, asteroid_group, plasma_group):
+    def ai_shoot_plasma(self, ctx, in_sight=None):
         
         if self.character_type != "enemy6":
             return
+        player, asteroid_group, plasma_group = ctx.player, ctx.asteroids, ctx.plasma
         
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             return  # cannot shoot while frozen
         
         from projectiles import Plasma
         
-        now = pygame.time.get_ticks()
-        # detection area
-        detection_rect = pygame.Rect(
-            self.rect.centerx -50,
-            self.rect.bottom,
-            100,
-            690
-        )
-        if detection_rect.colliderect(player.rect):
+        now = ctx.now
+        if in_sight is None:
+            in_sight = self.sees(player)
+        if in_sight:
             cooldown = self.plasma_cooldown * 2
             
             if now - getattr(self, "last_plasma_time", 0) >= cooldown:
@@ -643,7 +566,7 @@ class Character(pygame.sprite.Sprite):
                 offsets = [-10, 10] # left and right then lower by 5
                 
                 for x_off in offsets:
-                    plasma = Plasma(self, pygame.sprite.Group([player]), asteroid_group)
+                    plasma = Plasma.acquire(self, pygame.sprite.Group([player]), asteroid_group)
                     
                     # apply offsets
                     plasma.rect.centerx = center_x + x_off
@@ -655,7 +578,7 @@ class Character(pygame.sprite.Sprite):
                 config.channel_12.play(config.plasma_fx)
 
 
-    def ai_enemy7_shoot(self, player, enemy_group, asteroid_group, rockets_group, plasma_group):
+    def ai_enemy7_shoot(self, ctx, in_sight=None):
         """
         - 2 plasma bolts
         - 2 rockets
@@ -664,20 +587,17 @@ class Character(pygame.sprite.Sprite):
 
         if self.character_type != "enemy7" or not self.alive:
             return
+        player, asteroid_group, rockets_group, plasma_group = ctx.player, ctx.asteroids, ctx.rockets, ctx.plasma
         
         # check if frozen
-        if hasattr(self, 'frozen_until') and pygame.time.get_ticks() < self.frozen_until:
+        if hasattr(self, 'frozen_until') and ctx.now < self.frozen_until:
             return  # cannot shoot while frozen
             
-        now = pygame.time.get_ticks()
-        
-        detection_rect = pygame.Rect(
-            self.rect.centerx - 75, # 75 px to left
-            self.rect.bottom - 50,  # 50 px above enemy bottom
-            150,                    # width
-            800                     # height
-        )
-        if not detection_rect.colliderect(player.rect):
+        now = ctx.now
+        
+        if in_sight is None:
+            in_sight = self.sees(player)
+        if not in_sight:
             return
 
         # cooldowns 
@@ -692,7 +612,7 @@ class Character(pygame.sprite.Sprite):
             center_x, center_y = self.rect.center
             offsets = [(-15, 10), (15, 10)]
             for x_off, y_off in offsets:
-                plasma = Plasma(self, pygame.sprite.Group([player]), asteroid_group)
+                plasma = Plasma.acquire(self, pygame.sprite.Group([player]), asteroid_group)
                 plasma.rect.centerx = center_x + x_off
                 plasma.rect.centery = center_y + y_off
                 plasma_group.add(plasma)
@@ -706,7 +626,7 @@ class Character(pygame.sprite.Sprite):
             center_x, center_y = self.rect.center
             offsets = [-60, 60]
             for x_off in offsets:
-                rocket = Rocket(self, pygame.sprite.Group([player]), asteroid_group)
+                rocket = Rocket.acquire(self, pygame.sprite.Group([player]), asteroid_group)
                 rocket.rect.centerx = center_x + x_off
                 rocket.rect.centery = center_y - 40
                 rockets_group.add(rocket)
@@ -715,15 +635,9 @@ class Character(pygame.sprite.Sprite):
             
         # laser    
         if now - getattr(self, "last_shot_time", 0) >= laser_cooldown:
-            from projectiles import Laser
-            
-            center_x, center_y = self.rect.center
             offsets = [-26, 27]
             for x_off in offsets:
-                laser = Laser(self, player, enemy_group, asteroid_group)
-                laser.rect.midtop = (self.rect.centerx + x_off, self.rect.bottom - 155)
-                laser.prev_center = pygame.math.Vector2(laser.rect.center)# lasers are vectors
-                self.lasers.add(laser)
+                laser_engine.fire(self, pos=(self.rect.centerx + x_off, self.rect.bottom - 155))
             self.last_shot_time = now    
             config.laser_fx.play()
 
@@ -737,21 +651,27 @@ class HealthBar():
         self.max_health = health
         
 
-    def draw(self, health, shield=False):
-        from config import game_window, BLACK, CAYAN, WHITE, RED, GREEN
+    def draw(self, health, shield=False, surface=None, origin=(0, 0)):
+        """ - surface: where to draw (the game window when None)
+            - origin: top left of surface in screen coordinates (the hud layer)
+        """
+        if surface is None:
+            surface = config.game_window
         self.health = health
         self.shield = shield
         # calculate health ratio
         ratio = self.health / self.max_health
+        x = self.healthBar_x + 50 - origin[0]
+        y = self.healthBar_y - origin[1]
 
         if self.shield:
-            pygame.draw.rect(game_window, BLACK, (self.healthBar_x + 50, self.healthBar_y -2, 174, 9))
-            pygame.draw.rect(game_window, WHITE, (self.healthBar_x + 50, self.healthBar_y, 170, 6))
-            pygame.draw.rect(game_window, CAYAN, (self.healthBar_x + 50, self.healthBar_y, 170 * ratio, 6))
+            pygame.draw.rect(surface, config.BLACK, (x, y - 2, 174, 9))
+            pygame.draw.rect(surface, config.WHITE, (x, y, 170, 6))
+            pygame.draw.rect(surface, config.CAYAN, (x, y, 170 * ratio, 6))
         else:
-            pygame.draw.rect(game_window, BLACK, (self.healthBar_x + 50, self.healthBar_y -2, 174, 9))
-            pygame.draw.rect(game_window, RED, (self.healthBar_x + 50, self.healthBar_y, 170, 6))
-            pygame.draw.rect(game_window, GREEN, (self.healthBar_x + 50, self.healthBar_y, 170 * ratio, 6))
+            pygame.draw.rect(surface, config.BLACK, (x, y - 2, 174, 9))
+            pygame.draw.rect(surface, config.RED, (x, y, 170, 6))
+            pygame.draw.rect(surface, config.GREEN, (x, y, 170 * ratio, 6))
 
         
 
@@ -760,8 +680,8 @@ for i in range(3): # assume 3 images in explosion folder
     img = pygame.image.load(f'img/death/{i}.png').convert_alpha()
     explosion_frames.append(img)
 
-# when ship dies add explosion
-class Explosion(pygame.sprite.Sprite):
+# when ship dies add explosion (pooled, create with Explosion.acquire)
+class Explosion(Pooled, pygame.sprite.Sprite):
     def __init__(self, center, frames, frame_duration=80):
         """
         center: (x, y)
@@ -769,9 +689,13 @@ class Explosion(pygame.sprite.Sprite):
         frame_duration: ms to show each frame in
         """
         super().__init__()
+        self.reset(center, frames, frame_duration)
+
+
+    def reset(self, center, frames, frame_duration=80):
         self.frames = frames
         self.frame_duration = frame_duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = sim_clock.get_ticks()
         self.index = 0
         
         self.image = self.frames[self.index]
@@ -779,8 +703,8 @@ class Explosion(pygame.sprite.Sprite):
         
 
     # custom update method
-    def update(self):
-        now = pygame.time.get_ticks()
+    def update(self, ctx):
+        now = ctx.now
         elapsed = now - self.start_time
         
         # switch to next frame
@@ -792,10 +716,6 @@ class Explosion(pygame.sprite.Sprite):
         self.image = self.frames[self.index]
         self.rect = self.image.get_rect(center=self.rect.center)
         
-    
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
-
 
 
 # Create special enemy , use inheritance from base class character
@@ -827,15 +747,15 @@ class Mothership(Character):
         self.enemy_type = 8
         
         # setup for movement
-        self.vx = random.choice([-4, 4]) * max(0.6, self.velocity)
-        self.vy = random.choice([-4, 4]) * max(0.6, self.velocity)
-        self.last_spawn_time = pygame.time.get_ticks()
+        self.vx = rng.gameplay.choice([-4, 4]) * max(0.6, self.velocity)
+        self.vy = rng.gameplay.choice([-4, 4]) * max(0.6, self.velocity)
+        self.last_spawn_time = sim_clock.get_ticks()
         self.spawn_interval = Mothership.SPAWN_INTERVAL_MS
         self.screen_W = config.SCREEN_WIDTH
         self.screen_h = config.SCREEN_HEIGHT
     
 
-    def update(self, player):
+    def update(self, ctx):
         # move
         self.rect.x += int(self.vx)
         self.rect.y += int(self.vy)
@@ -855,30 +775,32 @@ class Mothership(Character):
             self.vy = -abs(self.vy)
             
         # add small random jitter to avoid predictable bouncing
-        if random.random() < 0.01:
-            self.vx += random.uniform(-0.4, 0.4)
-            self.vy += random.uniform(-0.4, 0.4)
+        if ctx.rng.random() < 0.01:
+            self.vx += ctx.rng.uniform(-0.4, 0.4)
+            self.vy += ctx.rng.uniform(-0.4, 0.4)
             # clamp the speed
             max_speed = max(1.2, self.velocity * 2.0)
             self.vx = max(-max_speed, min(max_speed, self.vx))
             self.vy = max(-max_speed, min(max_speed, self.vy))
             
         # spawn ufo fighters  
-        now = pygame.time.get_ticks()
+        now = ctx.now
         if now - self.last_spawn_time >= self.spawn_interval and self.alive: 
             self.last_spawn_time = now
-            self.spawn_fighter()
+            self.spawn_fighter(ctx)
             
         # preserve base class character flash and shield effect 
-        super().update(player)
+        super().update(ctx)
 
 
-    def spawn_fighter(self):
+    def spawn_fighter(self, ctx):
         """
             - Create small craft AI 9 from motherships hanger doors
             - Create from left,right,top,bottom center of rect
             - Add to enemy_group
         """
+        if not spawn_budget.allow('fighter'):
+            return
         positions = []
         cx, cy = self.rect.center
         # left hanger (left center)
@@ -890,16 +812,16 @@ class Mothership(Character):
         # bottom hanger (bottom center)
         positions.append((cx, self.rect.bottom + 20))
         
-        pos = random.choice(positions)
-        fighter = Fighter(pos[0], pos[1]) # default scale and velocity
+        pos = ctx.rng.choice(positions)
+        fighter = Fighter.acquire(pos[0], pos[1]) # default scale and velocity
         # ensure fighter starts inside the visible region when spawned
         fighter.rect.clamp_ip(pygame.Rect(0, 0, self.screen_W, self.screen_h))
-        enemy_group.add(fighter)
+        ctx.enemies.add(fighter)
 
 
 
-# fighter class for small craft out of hangers
-class Fighter(Character):
+# fighter class for small craft out of hangers (pooled, create with Fighter.acquire)
+class Fighter(Pooled, Character):
     """ 
         - small craft fighter
         - Spawns from mothership and moves randomly on screen
@@ -907,15 +829,21 @@ class Fighter(Character):
         - Uses same laser as base laser and enemy 3 does
     """
     def __init__(self, ship_x, ship_y, scale=0.45, velocity=2.2):
-        super().__init__("enemy9", ship_x, ship_y, scale, velocity)
+        pygame.sprite.Sprite.__init__(self)
+        self.reset(ship_x, ship_y, scale, velocity)
+
+
+    def reset(self, ship_x, ship_y, scale=0.45, velocity=2.2):
+        # every cooldown, timer and flag of the last life is reassigned, frames are shared so this is cheap
+        self.reset_state("enemy9", ship_x, ship_y, scale, velocity)
         # random initial direction 
-        self.vx = random.choice([-1, 1]) * self.velocity // 2
-        self.vy = random.choice([-1, 1]) * self.velocity // 2
+        self.vx = rng.gameplay.choice([-1, 1]) * self.velocity // 2
+        self.vy = rng.gameplay.choice([-1, 1]) * self.velocity // 2
         self.screen_w = config.SCREEN_WIDTH
         self.screen_h = config.SCREEN_HEIGHT
         
     
-    def update(self, player):
+    def update(self, ctx):
         # move
         self.rect.x += int(self.vx)
         self.rect.y += int(self.vy)
@@ -935,9 +863,9 @@ class Fighter(Character):
             self.vy = -abs(self.vy)
         
         # change direction randomly every now and then
-        if random.random() < 0.02:
-            self.vx += random.uniform(-1.2, 1.2)
-            self.vy += random.uniform(-3.8, 3.8)
+        if ctx.rng.random() < 0.02:
+            self.vx += ctx.rng.uniform(-1.2, 1.2)
+            self.vy += ctx.rng.uniform(-3.8, 3.8)
 
             # clamp speed so it does not go close to zero 
             max_speed = max(1.5, self.velocity * 2.2)
@@ -951,4 +879,4 @@ class Fighter(Character):
             self.vy = max(-max_speed, min(max_speed, self.vy))
             
         # call update and ai shoot methods like shoot_laser from base class
-        super().update(player)
\ No newline at end of file
+        super().update(ctx)
\ No newline at end of file
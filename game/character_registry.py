@@ -0,0 +1,92 @@
+import os
+import pygame # type: ignore
+
+import config
+import asset_cache
+
+
+# Per type character data shared by every instance (flyweight)
+#  - idle, damage flash and shield flash frames are scaled once per (character type, scale)
+#  - stats and death rewards are looked up once per type
+#  - a spawn only creates the Character object, it never decodes or copies a surface
+#  - the shared surfaces are read only, draw code copies before changing them
+#  - draw variants (flipped, frozen tint) of every frame are built once per type on first use,
+#    drawing a character is one blit of a cached surface
+
+IDLE_FOLDERS = ('Idle', 'idle') # mothership (enemy8) and fighter (enemy9) use a lowercase folder
+FLASH_FRAMES = 2
+SHIELD_FRAMES = 2
+
+DEFAULT_STATS = {'health': 100, 'shield': -1}
+DEFAULT_REWARD = {'score': 70, 'shield': 30, 'health': 0}
+
+FROZEN_TINT = (120, 200, 255, 80)
+FROZEN_OUTLINE = (180, 240, 255, 150)
+
+
+def _idle_path(name):
+    for folder in IDLE_FOLDERS:
+        path = f'img/{name}/{folder}/0.png'
+        if os.path.exists(path):
+            return path
+    return f'img/{name}/{IDLE_FOLDERS[0]}/0.png' # missing, let the loader raise with the usual path
+
+
+class CharacterType:
+    def __init__(self, name, scale):
+        self.name = name
+        self.scale = scale
+        self.is_enemy = name.startswith("enemy")
+        self.stats = config.character_stats.get(name, DEFAULT_STATS)
+        self.reward = config.enemy_rewards.get(name, DEFAULT_REWARD)
+
+        idle_path = _idle_path(name)
+        raw = asset_cache.get_image(idle_path)
+        self.size = (int(raw.get_width() * scale), int(raw.get_height() * scale))
+        self.idle = asset_cache.get_image(idle_path, size=self.size)
+
+        # flash frames are scaled to the idle size
+        self.flash_images = tuple(asset_cache.get_image(f'img/{name}/damage/{i}.png', size=self.size) for i in range(FLASH_FRAMES))
+        self.shield_images = tuple(asset_cache.get_image(f'img/{name}/shield/{i}.png', size=self.size) for i in range(SHIELD_FRAMES))
+
+        self.variants = {} # (frame, flip, frozen) -> surface
+
+
+    def variant(self, frame, flip=False, frozen=False):
+        """Draw ready version of one frame (idle, damage or shield flash), built on first use"""
+        key = (frame, flip, frozen)
+        surface = self.variants.get(key)
+        if surface is None:
+            surface = frame
+            if frozen:
+                surface = _frozen(surface)
+            if flip:
+                surface = pygame.transform.flip(surface, True, False)
+            self.variants[key] = surface
+        return surface
+
+
+
+def _frozen(frame):
+    """Ice tinted copy of a frame with a dotted outline"""
+    img = frame.copy()
+    mask = pygame.mask.from_surface(img)
+    ice_surface = mask.to_surface(setcolor=FROZEN_TINT, unsetcolor=(0, 0, 0, 0))
+    img.blit(ice_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    for i, point in enumerate(mask.outline()):
+        if i % 2 == 0:
+            pygame.draw.circle(img, FROZEN_OUTLINE, point, 1)
+    return img
+
+
+
+_types = {}
+
+
+def get_type(name, scale):
+    """Shared data for one character type at one scale, built on first use"""
+    key = (name, scale)
+    character_type = _types.get(key)
+    if character_type is None:
+        character_type = _types[key] = CharacterType(name, scale)
+    return character_type
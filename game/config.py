@@ -3,23 +3,65 @@ from pygame import mixer # type: ignore
 import os
 
 
+# headless mode (dummy video/audio drivers, no window, keyboard or sound card needed)
+HEADLESS = os.environ.get('MUSH_HEADLESS') == '1'
+HEADLESS_SIZE = (1920, 1080)
+if HEADLESS:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# record every played level to this file (replay it with game/headless.py --replay)
+RECORD_PATH = os.environ.get('MUSH_RECORD')
+
+# render scale (MUSH_RENDER_SCALE=0.5 draws the play field of a 4k display at 1080p and upscales it once per frame)
+#  - SCREEN_WIDTH / SCREEN_HEIGHT are the logical size (the display) at every scale, simulation, clamping, spawns,
+#    replays and the HUD / menu layout never see the render scale
+#  - the play field (background, sprites, projectiles, vfx) is drawn into internal_surface (INTERNAL_* = SCREEN_* * scale),
+#    its draw code multiplies logical coordinates by RENDER_SCALE and sprites go through the render queue
+#  - present_play_field() upscales it onto game_window once per frame, HUD, overlays and menus draw on game_window
+#  - 1.0 (default) draws the play field straight onto game_window, nothing is mapped or scaled
+MIN_RENDER_SCALE = 0.25
+try:
+    RENDER_SCALE = min(1.0, max(MIN_RENDER_SCALE, float(os.environ.get('MUSH_RENDER_SCALE', '1'))))
+except ValueError:
+    RENDER_SCALE = 1.0
+
 pygame.init()
 pygame.mixer.init()
 pygame.mixer.set_num_channels(16) # have 16 channels to play sound
 
 pygame.display.set_caption('MushMush')
 
-# Width and Height of screen
-INTERNAL_WIDTH = 1600
-INTERNAL_HEIGHT = 800
-internal_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+# Fullscreen mode (fixed size offscreen window when headless)
+if HEADLESS:
+    DISPLAY_WIDTH, DISPLAY_HEIGHT = HEADLESS_SIZE
+    display_surface = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT))
+else:
+    display_info = pygame.display.Info()
+    DISPLAY_WIDTH = display_info.current_w
+    DISPLAY_HEIGHT = display_info.current_h
+
+    display_surface = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT), pygame.FULLSCREEN)
+
+# Width and Height of screen (logical size, everything outside the play field draws to game_window)
+SCREEN_WIDTH, SCREEN_HEIGHT = DISPLAY_WIDTH, DISPLAY_HEIGHT
+game_window = display_surface
+
+# play field render target
+if RENDER_SCALE < 1.0:
+    INTERNAL_WIDTH = int(SCREEN_WIDTH * RENDER_SCALE)
+    INTERNAL_HEIGHT = int(SCREEN_HEIGHT * RENDER_SCALE)
+    internal_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT)).convert(display_surface) # display format for the scaled blit
+else:
+    INTERNAL_WIDTH, INTERNAL_HEIGHT = SCREEN_WIDTH, SCREEN_HEIGHT
+    internal_surface = game_window
+
 
-# Fullscreen mode
-display_info = pygame.display.Info()
-SCREEN_WIDTH = display_info.current_w
-SCREEN_HEIGHT = display_info.current_h
+def present_play_field():
+    """Upscale the finished play field onto game_window (nothing to do at scale 1.0)"""
+    if internal_surface is not game_window:
+        pygame.transform.scale(internal_surface, (SCREEN_WIDTH, SCREEN_HEIGHT), game_window)
 
-game_window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
 
 # game time and frames
 frameRate = pygame.time.Clock() # get time
@@ -0,0 +1,62 @@
+# Entity registry, secondary indexes over the indexed sprite groups
+#  - per group: sprites by character type (is a mothership alive) and by owner (the laser line of one enemy4)
+#  - kept up to date by IndexedGroup on add and remove (kill, empty), a lookup never scans a group
+#  - capabilities (e.g. 'shield') are probed once per class, every instance of a class sets the same attributes
+#  - indexes are insertion ordered dicts and not sets, so iterating them is the same in every replay
+
+# capability -> attributes an entity needs to have it
+CAPABILITIES = {
+    'shield': ('character_type', 'shield'),
+}
+
+OWNER_ATTR = 'character' # laser lines point at the character firing them
+
+
+class EntityRegistry:
+    def __init__(self):
+        self.by_type = {} # group -> {character_type: {sprite: None}}
+        self.by_owner = {} # group -> {owner: sprite}
+        self.capabilities = {} # class -> frozenset of capability names
+
+
+    def add(self, group, sprite):
+        character_type = getattr(sprite, 'character_type', None)
+        if character_type is not None:
+            self.by_type.setdefault(group, {}).setdefault(character_type, {})[sprite] = None
+        owner = getattr(sprite, OWNER_ATTR, None)
+        if owner is not None:
+            self.by_owner.setdefault(group, {})[owner] = sprite
+
+
+    def remove(self, group, sprite):
+        sprites = self.by_type.get(group, {}).get(getattr(sprite, 'character_type', None))
+        if sprites:
+            sprites.pop(sprite, None) # pooled sprites leave their group before reset() changes the type
+        owners = self.by_owner.get(group)
+        if owners:
+            owner = getattr(sprite, OWNER_ATTR, None)
+            if owners.get(owner) is sprite:
+                del owners[owner]
+
+
+    def count(self, group, character_type):
+        return len(self.by_type.get(group, {}).get(character_type, ()))
+
+
+    def owned_by(self, group, owner):
+        """The sprite of group that belongs to owner, or None"""
+        return self.by_owner.get(group, {}).get(owner)
+
+
+    def has(self, entity, capability):
+        cls = type(entity)
+        caps = self.capabilities.get(cls)
+        if caps is None:
+            caps = self.capabilities[cls] = frozenset(
+                name for name, attrs in CAPABILITIES.items() if all(hasattr(entity, attr) for attr in attrs))
+        return capability in caps
+
+
+
+# registry shared by every indexed group
+registry = EntityRegistry()
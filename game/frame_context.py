@@ -0,0 +1,37 @@
+import rng
+import sim_clock
+import sprite_groups
+from projectile_manager import projectiles
+
+
+# Per step frame context handed to every entity update
+#  - the play loop builds one context per level and refreshes it at the start of every simulation step
+#  - now and dt are read from the simulation clock once per step, entities never call get_ticks in update or shooting code
+#  - player, group handles and the gameplay rng travel with it instead of being looked up in module globals
+#  - nothing here touches the display, so a step runs the same without a window (headless, benchmark, replays)
+
+class FrameContext:
+    __slots__ = ('step', 'now', 'dt', 'player', 'enemies', 'asteroids', 'rockets', 'plasma', 'ice', 'beams',
+                 'explosions', 'blackholes', 'gravity_groups', 'rng')
+
+    def __init__(self, player):
+        self.step = 0
+        self.now = sim_clock.get_ticks()
+        self.dt = sim_clock.STEP_MS
+        self.player = player
+        self.enemies = sprite_groups.enemy_group
+        self.asteroids = sprite_groups.asteroid_group
+        self.rockets = sprite_groups.rockets_group
+        self.plasma = sprite_groups.plasma_group
+        self.ice = projectiles.ice # list owned by the projectile manager, only ever changed in place
+        self.beams = sprite_groups.enemy_beam_group
+        self.explosions = sprite_groups.explosion_group
+        self.blackholes = sprite_groups.blackholes_group
+        self.gravity_groups = (self.enemies, self.asteroids, self.rockets) # what black holes pull besides the player
+        self.rng = rng.gameplay
+
+
+    def begin_step(self, step):
+        """Refresh the per step values (call right after the simulation clock advanced)"""
+        self.step = step
+        self.now = sim_clock.get_ticks()
@@ -0,0 +1,74 @@
+import gc
+import time
+from collections import deque
+
+
+# Garbage collection policy for the game loop
+#  - most projectiles and particles die by reference counting, only cycles (sprite <-> group, shooter <-> laser) need the collector
+#  - generation thresholds are raised so short lived churn does not trigger constant young collections
+#  - the heap is frozen once level assets are loaded, so long lived surfaces and tables are never walked again
+#  - automatic full collections are pushed out of reach, gen 2 is only collected at safe points (death transition, level transition, menu)
+#  - every collection pause is timed, the profiler overlay and the benchmark report show them per generation
+
+GEN0_THRESHOLD = 5000 # allocations before a young collection (default 700)
+GEN1_THRESHOLD = 20
+GEN2_THRESHOLD = 1_000_000 # gen1 collections before an automatic full one, never reached in a level: full collections run at the safe points
+
+MAX_PAUSE_SAMPLES = 240
+
+_pauses = deque(maxlen=MAX_PAUSE_SAMPLES) # (generation, ms, reason)
+_state = {'pause_start': 0.0, 'reason': None, 'configured': False}
+
+
+def _on_gc(phase, info):
+    if phase == "start":
+        _state['pause_start'] = time.perf_counter()
+    else:
+        ms = (time.perf_counter() - _state['pause_start']) * 1000
+        _pauses.append((info.get("generation", 0), ms, _state['reason'] or "auto"))
+
+
+def configure():
+    """Install thresholds and pause timing (safe to call more than once)"""
+    if _state['configured']:
+        return
+    gc.enable()
+    gc.set_threshold(GEN0_THRESHOLD, GEN1_THRESHOLD, GEN2_THRESHOLD)
+    gc.callbacks.append(_on_gc)
+    _state['configured'] = True
+
+
+def freeze_after_load():
+    """Collect once and move everything alive into the permanent generation
+       - call after level assets and the player are created
+    """
+    _state['reason'] = "level_load"
+    gc.collect()
+    _state['reason'] = None
+    gc.freeze()
+
+
+def collect_at_safe_point(reason):
+    """Full collection at a point where a pause can not be seen (transitions and menus)"""
+    gc.unfreeze() # let the last level's frozen objects be released
+    _state['reason'] = reason
+    gc.collect()
+    _state['reason'] = None
+
+
+def pause_stats():
+    """Per generation count, mean and max pause in ms of the recorded collections"""
+    stats = {}
+    for generation, ms, _ in _pauses:
+        entry = stats.setdefault(generation, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        entry['count'] += 1
+        entry['total_ms'] += ms
+        entry['max_ms'] = max(entry['max_ms'], ms)
+    for entry in stats.values():
+        entry['mean_ms'] = entry['total_ms'] / entry['count']
+    return stats
+
+
+def clear_pauses():
+    """Forget the recorded pauses (the benchmark reports each scenario on its own)"""
+    _pauses.clear()
@@ -0,0 +1,111 @@
+"""Headless simulation runner
+   - runs start_game(level) for N simulated steps on the SDL dummy drivers (no display, keyboard or sound card)
+   - skips drawing but keeps every update, steps run as fast as the machine allows
+   - input comes from a named script instead of the keyboard
+
+   - sessions can be recorded (--record) and replayed exactly (--replay), the seed fixes every gameplay roll
+
+   run from the repository root:
+   python game/headless.py --level 2 --frames 3600 --script fire_all
+   python game/headless.py --seed 7 --record session.rep
+   python game/headless.py --replay session.rep
+"""
+import os, time, argparse
+
+os.environ['MUSH_HEADLESS'] = '1' # must be set before config is imported
+
+import config
+import main
+import replay
+import rng
+import sim_clock
+
+
+# ___ input scripts: step -> input state (None keeps the current state) ___
+def script_idle(step):
+    return None
+
+
+def script_fire_all(step):
+    # hold every weapon, strafe left and right every 2 seconds
+    going_left = (step // 120) % 2 == 0
+    return {
+        'shooting': True, 'heavy_shooting': True, 'rocket': True,
+        'laserLine_fire': True, 'plasma_shooting': True, 'ice_shooting': True,
+        'moving_left': going_left, 'moving_right': not going_left,
+    }
+
+
+def script_strafe(step):
+    going_left = (step // 90) % 2 == 0
+    return {'shooting': True, 'moving_left': going_left, 'moving_right': not going_left}
+
+
+SCRIPTS = {
+    'idle': script_idle,
+    'fire_all': script_fire_all,
+    'strafe': script_strafe,
+}
+
+
+def run(level=2, frames=3600, script='fire_all', render=False, seed=None, record=None):
+    """Simulate a level for a number of steps and return the throughput
+       - script: a name from SCRIPTS or an input script function
+       - record: path to save the session to
+    """
+    input_script = SCRIPTS[script] if isinstance(script, str) else script
+    recorder = replay.Recorder() if record else None
+    counter = {'steps': 0}
+
+    def counted_script(step):
+        counter['steps'] = step + 1
+        return input_script(step)
+
+    start = time.perf_counter()
+    result = main.start_game(level, max_steps=frames, input_script=counted_script, render=render,
+                             seed=seed, recorder=recorder)
+    elapsed = time.perf_counter() - start
+    if recorder is not None:
+        recorder.save(record)
+    steps = counter['steps'] # fewer than asked when the player dies
+    return {
+        'level': level,
+        'steps': steps,
+        'script': script if isinstance(script, str) else 'replay',
+        'seed': rng.current_seed(),
+        'result': result,
+        'seconds': elapsed,
+        'steps_per_second': steps / elapsed if elapsed > 0 else 0.0,
+        'score': config.score,
+    }
+
+
+def run_replay(path, render=False):
+    """Re-run a recorded session step for step"""
+    session = replay.load(path)
+    if session.screen_size != (config.SCREEN_WIDTH, config.SCREEN_HEIGHT):
+        print(f"warning: recorded at {session.screen_size}, running at {(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)}, "
+              f"spawn positions will differ")
+    if session.clock_start != sim_clock.LEVEL_START_MS:
+        print(f"warning: recorded with clock start {session.clock_start}, running with {sim_clock.LEVEL_START_MS}")
+    return run(session.level, session.steps, session.input_script, render, seed=session.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the game simulation without a display")
+    parser.add_argument('--level', type=int, default=2)
+    parser.add_argument('--frames', type=int, default=3600, help="simulation steps to run (60 per second of game time)")
+    parser.add_argument('--script', choices=sorted(SCRIPTS), default='fire_all')
+    parser.add_argument('--render', action='store_true', help="also draw every step into the offscreen window")
+    parser.add_argument('--seed', type=int, default=None, help="gameplay seed (random when not given)")
+    parser.add_argument('--record', metavar='PATH', help="save the session to a replay file")
+    parser.add_argument('--replay', metavar='PATH', help="re-run a recorded session (level, seed and inputs come from the file)")
+    args = parser.parse_args()
+
+    if args.replay:
+        stats = run_replay(args.replay, args.render)
+    else:
+        stats = run(args.level, args.frames, args.script, args.render, args.seed, args.record)
+    print(f"{stats['steps']} steps in {stats['seconds']:.2f}s "
+          f"({stats['steps_per_second']:.0f} steps/s, {stats['steps_per_second'] / config.FPS:.1f}x real time), "
+          f"result: {stats['result']}, score: {stats['score']}, seed: {stats['seed']}")
@@ -0,0 +1,61 @@
+import pygame # type: ignore
+
+import config
+
+
+# Play screen HUD compositor
+#  - text is rendered once per (text, font, colour) and kept, a changed value renders one new line
+#  - health and shield bars, labels, score and wave count are composed onto one small layer surface
+#  - the layer is only recomposed when a shown value changed, drawing the HUD is one blit
+
+HUD_RECT = pygame.Rect(0, 780, 320, 120) # covers the bars and the four text lines
+MAX_TEXTS = 256 # rendered strings kept (scores change often, the cache is dropped when full)
+
+_texts = {}
+
+
+def render_text(text, font, colour):
+    """Rendered surface for a string (shared, never draw onto it)"""
+    key = (text, font, colour)
+    img = _texts.get(key)
+    if img is None:
+        if len(_texts) >= MAX_TEXTS:
+            _texts.clear()
+        img = _texts[key] = font.render(text, True, colour)
+    return img
+
+
+
+class HUD:
+    def __init__(self, health_bar, shield_bar):
+        self.health_bar = health_bar
+        self.shield_bar = shield_bar
+        self.layer = pygame.Surface(HUD_RECT.size, pygame.SRCALPHA)
+        self.shown = None # values on the layer
+        self.recomposes = 0 # shown in the profiler overlay, only grows when a value changes
+
+
+    def draw(self, surface, health, shield, score, target_score, wave):
+        shown = (health, shield, score, target_score, wave)
+        if shown != self.shown:
+            self.compose(*shown)
+            self.shown = shown
+        surface.blit(self.layer, HUD_RECT.topleft)
+
+
+    def compose(self, health, shield, score, target_score, wave):
+        layer = self.layer
+        origin = HUD_RECT.topleft
+        layer.fill((0, 0, 0, 0))
+        self.health_bar.draw(health, shield=False, surface=layer, origin=origin)
+        self.shield_bar.draw(shield, shield=True, surface=layer, origin=origin)
+
+        lines = (
+            ('Health:', config.WHITE, 790),
+            ('Shield:', config.WHITE, 810),
+            (f'Score: {score} / {target_score}', config.WHITE, 830),
+            (f'Waves: {wave}', config.RED, 870),
+        )
+        for text, colour, y in lines:
+            layer.blit(render_text(text, config.font, colour), (10 - origin[0], y - origin[1]))
+        self.recomposes += 1
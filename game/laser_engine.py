@@ -0,0 +1,222 @@
+import numpy as np
+import pygame # type: ignore
+
+import config
+import asset_cache
+from projectiles import apply_damage
+
+
+# Structure of arrays engine for straight line shots (laser and heavy laser)
+#  - every shot is one slot in a set of numpy arrays (position, velocity, damage, kind, owner)
+#  - one vectorized step moves all shots, absorbs them in black holes and culls them off screen
+#  - the broad phase finds candidate hits for all shots at once, only those reach apply_damage
+#  - shots live here and not in the shooter, so they keep flying after the shooter dies
+
+LASER_IMAGE = "img/laser/laser.png"
+HEAVY_LASER_IMAGE = "img/heavyLaser/heavylaser.png"
+HEAVY_LASER_SIZE = (18, 45)
+
+# shot kinds
+PLAYER_LASER = 0
+ENEMY_LASER = 1
+PLAYER_HEAVY = 2
+ENEMY_HEAVY = 3
+
+KIND_NAMES = ('player_laser', 'enemy_laser', 'player_heavy', 'enemy_heavy')
+
+# damage and pixels per step (player shots were stepped twice per frame by the old sprite loop, so their speed is doubled here)
+KIND_STATS = {
+    PLAYER_LASER: {'damage': 10, 'velocity': -24},
+    ENEMY_LASER:  {'damage': 10, 'velocity': 12},
+    PLAYER_HEAVY: {'damage': 50, 'velocity': -28},
+    ENEMY_HEAVY:  {'damage': 10, 'velocity': 6},
+}
+
+
+def _rect_array(sprites):
+    """(n, 4) int array of left, top, right, bottom"""
+    return np.array([(s.rect.left, s.rect.top, s.rect.right, s.rect.bottom) for s in sprites], dtype=np.int32).reshape(-1, 4)
+
+
+class LaserEngine:
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.images = None # per kind surface, loaded on first shot (needs the display)
+        self.kind_w = None
+        self.kind_h = None
+        self._allocate(capacity)
+
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.int32) # centre x
+        self.y = np.zeros(capacity, dtype=np.int32) # centre y
+        self.vy = np.zeros(capacity, dtype=np.int32)
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.enemy_owned = np.zeros(capacity, dtype=bool)
+        self.owner = np.empty(capacity, dtype=object)
+
+
+    def _grow(self):
+        n = self.count
+        old = (self.x, self.y, self.vy, self.damage, self.kind, self.enemy_owned, self.owner)
+        self._allocate(self.capacity * 2)
+        for new, prev in zip((self.x, self.y, self.vy, self.damage, self.kind, self.enemy_owned, self.owner), old):
+            new[:n] = prev[:n]
+
+
+    def _load_images(self):
+        self.images = (
+            asset_cache.get_image(LASER_IMAGE),
+            asset_cache.get_image(LASER_IMAGE, flip=(False, True)),
+            asset_cache.get_image(HEAVY_LASER_IMAGE, size=HEAVY_LASER_SIZE),
+            asset_cache.get_image(HEAVY_LASER_IMAGE, size=HEAVY_LASER_SIZE, flip=(False, True)),
+        )
+        self.kind_w = np.array([img.get_width() for img in self.images], dtype=np.int32)
+        self.kind_h = np.array([img.get_height() for img in self.images], dtype=np.int32)
+
+
+    def clear(self):
+        self.owner[:self.count] = None
+        self.count = 0
+
+
+    def fire(self, shooter, heavy=False, pos=None):
+        """Add one shot
+           - pos: midtop of an enemy shot / midbottom of a player shot (defaults to the shooter's front)
+        """
+        if self.images is None:
+            self._load_images()
+        if self.count == self.capacity:
+            self._grow()
+
+        enemy = shooter.character_type.startswith("enemy")
+        if heavy:
+            kind = ENEMY_HEAVY if enemy else PLAYER_HEAVY
+        else:
+            kind = ENEMY_LASER if enemy else PLAYER_LASER
+        h = int(self.kind_h[kind])
+        if pos is None:
+            pos = shooter.rect.midbottom if enemy else shooter.rect.midtop
+
+        i = self.count
+        self.x[i] = pos[0]
+        self.y[i] = pos[1] + h // 2 if enemy else pos[1] - h + h // 2 # same centre as rect(midtop/midbottom=pos)
+        self.vy[i] = KIND_STATS[kind]['velocity']
+        self.damage[i] = KIND_STATS[kind]['damage']
+        self.kind[i] = kind
+        self.enemy_owned[i] = enemy
+        self.owner[i] = shooter
+        self.count += 1
+
+
+    def _bounds(self, n):
+        kind = self.kind[:n]
+        w = self.kind_w[kind]
+        h = self.kind_h[kind]
+        left = self.x[:n] - w // 2
+        top = self.y[:n] - h // 2
+        return left, top, left + w, top + h
+
+
+    def step(self, player, enemy_group, asteroid_group, blackholes_group):
+        """Move, absorb, cull and collide every shot once"""
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        alive = np.ones(n, dtype=bool)
+
+        # black holes absorb shots whose travel path crosses them (same as clipline on the old per laser segment)
+        new_y = y + self.vy[:n]
+        if blackholes_group:
+            low = np.minimum(y, new_y)
+            high = np.maximum(y, new_y)
+            for bh in blackholes_group:
+                r = bh.rect
+                alive &= ~((x >= r.left) & (x < r.right) & (high >= r.top) & (low < r.bottom))
+        y[:] = new_y
+
+        left, top, right, bottom = self._bounds(n)
+        alive &= ~((bottom < 0) | (top > config.SCREEN_HEIGHT))
+
+        for shot, target, dmg, is_asteroid in self._broad_phase(alive, left, top, right, bottom, player, enemy_group, asteroid_group):
+            # narrow phase
+            if is_asteroid:
+                target.health -= dmg
+            else:
+                apply_damage(target, dmg)
+            alive[shot] = False
+
+        self._compact(alive)
+
+
+    def _broad_phase(self, alive, left, top, right, bottom, player, enemy_group, asteroid_group):
+        """Candidate hits as (shot index, target, damage, is_asteroid), first target in group order per shot"""
+        hits = []
+        damage = self.damage
+        enemy_owned = self.enemy_owned[:len(alive)]
+
+        # enemy shots only hit the player
+        if player is not None:
+            r = player.rect
+            hit = alive & enemy_owned & (left < r.right) & (right > r.left) & (top < r.bottom) & (bottom > r.top)
+            for shot in np.flatnonzero(hit):
+                hits.append((shot, player, int(damage[shot]), False))
+
+        # player shots hit the first enemy, otherwise the first asteroid
+        shots = np.flatnonzero(alive & ~enemy_owned)
+        for group, is_asteroid in ((enemy_group, False), (asteroid_group, True)):
+            if shots.size == 0:
+                break
+            targets = list(group)
+            if not targets:
+                continue
+            rects = _rect_array(targets)
+            overlap = ((left[shots, None] < rects[None, :, 2]) & (right[shots, None] > rects[None, :, 0]) &
+                       (top[shots, None] < rects[None, :, 3]) & (bottom[shots, None] > rects[None, :, 1]) &
+                       (rects[None, :, 2] > rects[None, :, 0]) & (rects[None, :, 3] > rects[None, :, 1]))
+            any_hit = overlap.any(axis=1)
+            first = overlap.argmax(axis=1)
+            for shot, target_index in zip(shots[any_hit], first[any_hit]):
+                hits.append((shot, targets[target_index], int(damage[shot]), is_asteroid))
+            shots = shots[~any_hit]
+        return hits
+
+
+    def _compact(self, alive):
+        n = self.count
+        keep = np.flatnonzero(alive)
+        k = keep.size
+        if k == n:
+            return
+        for arr in (self.x, self.y, self.vy, self.damage, self.kind, self.enemy_owned, self.owner):
+            arr[:k] = arr[keep]
+        self.owner[k:n] = None # release shooters
+        self.count = k
+
+
+    def draw_items(self):
+        """(image, topleft) pairs of every live shot grouped by shooter, in firing order, ready for Surface.blits"""
+        n = self.count
+        if n == 0:
+            return {}
+        left, top, _, _ = self._bounds(n)
+        images = self.images
+        by_owner = {}
+        for owner, k, l, t in zip(self.owner[:n], self.kind[:n].tolist(), left.tolist(), top.tolist()):
+            by_owner.setdefault(owner, []).append((images[k], (l, t)))
+        return by_owner
+
+
+    def counts(self):
+        """Number of live shots per kind"""
+        per_kind = np.bincount(self.kind[:self.count], minlength=len(KIND_NAMES))
+        return {name: int(c) for name, c in zip(KIND_NAMES, per_kind)}
+
+
+
+# engine shared by every shooter
+lasers = LaserEngine()
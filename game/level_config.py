@@ -27,7 +27,8 @@ LEVELS = {
         'blackholes_enabled': False,
         'mothership_enabled': False,
         
-        # background
+        # background (scroll_speed: pixels per step, also moves comets and thruster particles)
+        'scroll_speed': 2,
         'background_files': [
             'img/background/space.png'
         ],
@@ -64,7 +65,8 @@ LEVELS = {
         'blackholes_enabled': True,
         'mothership_enabled': True,
         
-        # background
+        # background (scroll_speed: pixels per step, also moves comets and thruster particles)
+        'scroll_speed': 2,
         'background_files': [
             'img/background/sd3.png',
             'img/background/sd2.png', 
@@ -94,9 +96,10 @@ def get_available_levels():
 def load_background_images(level_config):
     """Load and scale background images for a level"""
     import pygame
+    import config
     
     background_list = []
-    screen_width, screen_height = pygame.display.get_surface().get_size()
+    screen_width, screen_height = config.internal_surface.get_size() # play field render size
     
     for file in level_config['background_files']:
         if os.path.exists(file):
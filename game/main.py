@@ -1,25 +1,40 @@
 import pygame # type: ignore
-import os, gc
+import os
 from pygame import mixer # type: ignore
-import random
 
 import config
 import menu
 import characterClass
 from spaceObjects import Asteroid, BlackHole
 from projectiles import LaserLine
+from projectile_manager import projectiles as projectile_manager
 from sprite_groups import (
     enemy_group, 
-    player_lasers,  
-    heavyLaser_group, 
     rockets_group, 
     asteroid_group, 
     enemy_beam_group, 
     explosion_group,
     blackholes_group,
-    enemy_lasers,
-    plasma_group)
-from level_config import get_level_config, load_background_images
+    plasma_group,
+    rebuild_spatial_index)
+from level_config import get_level_config
+import background_store
+import asteroid_variants
+import blackhole_frames
+import gc_policy
+import sim_clock
+import rng
+import replay
+import object_pool
+import spawn_budget
+from ai_scheduler import scheduler as ai_scheduler
+from entity_registry import registry as entity_registry
+from frame_context import FrameContext
+import sprite_groups
+import profiler
+from profiler import frame_profiler
+from hud import HUD
+from render_queue import render_queue
 
 from vfx_transition import Transition
 from vfx_level_star import FastStarVFX
@@ -42,45 +57,15 @@ is_paused = False # Track if the game music is paused or not
 song2_path = os.path.join('audio', 'Cyberpunk Background Music.mp3')
 song1_path = os.path.join('audio', 'Dark Techno EBM Background Music.mp3')
 
-# Play initial song on start
-play_music(song1_path)
-
-
-def draw_scrolling_bg(surface, background_list, state, speed=3):
-    screen_width = surface.get_width()
-    screen_height = surface.get_height()
-    state['y'] += speed
-    
-    num_images = len(background_list) # keep track of our list of images to loop
-    total_height = screen_height * num_images # get the total height of all pictures
-    
-    if state['y'] >= total_height:
-        state['y'] -= total_height
-        
-    # add first image again to loop seamlessly
-    imgs_to_draw = background_list + [background_list[0]] 
-    
-    for i, img in enumerate(imgs_to_draw):
-        y_pos = state['y'] - i * screen_height # preserve original scroll direction
-        
-        if y_pos < screen_height and y_pos + screen_height > 0:
-            # create rectangle for screen size to check if we should draw img or not / do not draw all images only the one on screen
-            source_rect = pygame.Rect(0, 0, screen_width, screen_height) 
-            
-            if y_pos < 0:
-                source_rect.top = -y_pos
-                source_rect.height = screen_height + y_pos
-            elif y_pos + screen_height > screen_height:
-                source_rect.height = screen_height - y_pos
-                
-            surface.blit(img, (0, max(y_pos, 0)), area=source_rect)
-
 
 def spawn_enemy(level_config):
-    x = random.randint(80, config.SCREEN_WIDTH - 80)
+    """Spawn one enemy of the level mix, False when the spawn budget is full"""
+    if not spawn_budget.allow('enemy'):
+        return False
+    x = rng.gameplay.randint(80, config.SCREEN_WIDTH - 80)
     y = -80 # spawn above screen
 
-    enemy_type = random.choices(
+    enemy_type = rng.gameplay.choices(
         level_config['enemy_types'],
         weights=level_config['enemy_weights'],
         k=1
@@ -89,7 +74,8 @@ def spawn_enemy(level_config):
     enemy = characterClass.Character(enemy_type, x, y, 0.5, 1)
     enemy_group.add(enemy)
     
-    enemy.flip = random.choice([True, False])
+    enemy.flip = rng.gameplay.choice([True, False])
+    return True
 
 STAR_COUNT = 150 # number of fast-moving stars
 STAR_SPEED = 10 # star scroll speed
@@ -100,20 +86,63 @@ def initialize_star_field(screen_width, screen_height, count):
     stars = []
     for _ in range(count):
         stars.append({
-            'x': random.randint(0, screen_width),
-            'y': random.randint(0, screen_height),
-            'size': random.randint(1, 2)
+            'x': rng.gameplay.randint(0, screen_width),
+            'y': rng.gameplay.randint(0, screen_height),
+            'size': rng.gameplay.randint(1, 2)
         })
     return stars
 
 star_field_state = {'stars': initialize_star_field(config.SCREEN_WIDTH, config.SCREEN_HEIGHT, STAR_COUNT)}
 
 
+# live objects per sprite group and per laser kind (profiler overlay, benchmarks)
+def entity_counts():
+    # rockets and plasma are counted by the projectile manager
+    counts = {name: len(group) for name, group in zip(sprite_groups.group_names, sprite_groups.all_groups)
+              if group is not projectile_manager.rockets and group is not projectile_manager.plasma}
+    counts.update(projectile_manager.counts())
+    return counts
+
+
+# last composed play frame, the death transition draws its overlay on it instead of redrawing the level
+death_snapshot = None
+
+
+def capture_death_snapshot():
+    # nothing draws between the last display update and the death check, so the window still holds the final frame
+    global death_snapshot
+    death_snapshot = config.game_window.copy()
+
+
+# apply a scripted input state, e.g. {'shooting': True, 'moving_left': False}
+def apply_input_state(input_state):
+    for flag, value in input_state.items():
+        setattr(config, flag, value)
+
+
 # ____ main ____
-def start_game(level_number=2):
+def start_game(level_number=2, max_steps=None, input_script=None, render=None, seed=None, recorder=None,
+               start_wave=1, setup=None):
+    """ - max_steps: stop after this many simulation steps and run them as fast as possible (headless runs)
+        - input_script: function(step) -> input state dict or None, applied before each step
+        - render: draw frames (defaults to off in headless mode)
+        - seed: gameplay random seed (a new one when None)
+        - recorder: replay.Recorder that stores the input state of every step
+        - start_wave: wave to start at, a later wave spawns right away (benchmark scenarios)
+        - setup: function(player) called once before the first step, e.g. to place extra objects
+    """
     global current_song
-    global player, thruster_vfx, star_vfx, health_bar, shield_bar, level_background_list, wave_count 
+    global player, thruster_vfx, star_vfx, hud, level_background, wave_count 
     
+    if render is None:
+        render = not config.HEADLESS
+
+    # seeded session, the same seed and inputs replay the same game
+    seed = rng.seed(seed)
+    sim_clock.set_time(sim_clock.LEVEL_START_MS)
+    if recorder is not None:
+        recorder.begin(seed, level_number, sim_clock.LEVEL_START_MS)
+
     # Get level configuration
     level_config = get_level_config(level_number)
     print(f"Starting {level_config['name']}")
@@ -127,28 +156,31 @@ def start_game(level_number=2):
     comet_spawn_interval = 240 
     comet_spawn_timer = 0
     
-    # Load background
-    level_background_list = load_background_images(level_config)
+    # Load background (cached per level, other levels are evicted)
+    background_store.retain(level_number)
+    level_background = background_store.get_background(level_number)
+
+    # asteroid variants and their split sizes, scaled once
+    asteroid_variants.preload()
+    spawn_budget.reset()
+    ai_scheduler.reset()
 
     # --- Ensure global sprite groups exist and are fresh (use .empty() to keep same Group objects) ---
+    projectile_manager.clear() # projectiles from the last run
+    render_queue.clear()
+    object_pool.release_groups(sprite_groups.all_groups)
     enemy_group.empty()
     asteroid_group.empty()
-    rockets_group.empty()
     explosion_group.empty()
-    heavyLaser_group.empty()
     blackholes_group.empty()
-    player_lasers.empty()
     enemy_beam_group.empty()
-    enemy_lasers.empty()
-    plasma_group.empty()
 
     # --- Create fresh player & UI objects for this run ---
     # create player object
     player = characterClass.Character('player', 950, 750, 2, 10)
     thruster_vfx = ThrusterVFX(player)
 
-    # ensure player's projectile container is a Group and linked
-    player.lasers = player_lasers
+    # link player targets
     player.asteroid_group = asteroid_group
     player.enemy_group = enemy_group
 
@@ -160,236 +192,61 @@ def start_game(level_number=2):
 
     health_bar = characterClass.HealthBar(55, 797, player.health, player.health)
     shield_bar = characterClass.HealthBar(55, 817, player.shield, player.shield)
+    hud = HUD(health_bar, shield_bar)
 
     # reset input flags so stale state doesn't persist
     config.moving_left = config.moving_right = config.moving_up = config.moving_down = False
     config.shooting = config.heavy_shooting = config.rocket = config.laserLine_fire = config.plasma_shooting = config.ice_shooting = False
     config.score = 0
+    config.motherShip_boss_active = False
+    config.mothership_wave = 0
 
     # clear pending events from last game played
     pygame.event.clear()
 
+    # black hole rotation tables, built now and not when the first black hole spawns
+    if level_config['blackholes_enabled']:
+        blackhole_frames.prebuild(BlackHole.visible_angle())
+
+    # level assets are loaded, keep them out of every later collection (headless and benchmark runs start here, not in run())
+    gc_policy.configure()
+    gc_policy.freeze_after_load()
+
+    if setup is not None:
+        setup(player)
+
     # Game state variables
     playing = True
-    scroll_speed = 2
-    scroll_y = 0 # background y scroll
-    wave_count = 1
-    ice_bullets = []
+    scroll_speed = level_config['scroll_speed']
+    wave_count = start_wave
     pending_spawns = 0 # track how many enemies are left in current wave
 
-    # Spawn events (use local event ids so no conflict)
-    SPAWN_EVENT = pygame.USEREVENT + 1
-    SPAWN_SINGLE_EVENT = pygame.USEREVENT + 2
+    # Spawn timers run on the simulation clock (a slow render frame can not delay a wave)
     spawn_interval = level_config['enemy_spawn_interval']
-    pygame.time.set_timer(SPAWN_EVENT, spawn_interval)
+    next_wave_time = sim_clock.get_ticks() + (spawn_interval if start_wave == 1 else 0)
+    next_single_spawn_time = None
+    stagger_interval = 1000 # delay between enemies of the same wave
 
+    # fixed timestep: the simulation always advances in STEP_MS steps, rendering happens once per loop
+    step_accumulator = 0.0
+    step_count = 0
+    ctx = FrameContext(player) # refreshed at the start of every step and passed to every update
+    config.frameRate.tick() # reset so the loading time is not simulated
 
-    while playing:
-        config.frameRate.tick(config.FPS) # get time and frame rate (loop rate)
-        config.game_window.fill(config.BLACK)
 
-        if player.health <= 0:
-            print("You died, health is: ", player.health, ", with a score of:", config.score)
-            
-            mission_complete = config.score >= config.target_score
-            outcome_color = "green" if mission_complete else "red"
-            
-            global transition
-            transition = LevelTransition(config.game_window, outcome_color=outcome_color)
-            return "death_transition"
-        
-        draw_scrolling_bg(config.game_window, level_background_list, config.scroll_state, speed=2)
-        
-        star_vfx.update()
-        star_vfx.draw(config.game_window)
+    prof = frame_profiler
 
-        comet_spawn_timer += 1
-        if comet_spawn_timer > comet_spawn_interval:
-            comets.append(Comet(config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-            comet_spawn_timer = 0
-            
-        # Update & draw comets
-        for comet in comets:
-            comet.update(scroll_speed)
-            comet.draw(config.game_window)
-
-        is_moving = config.moving_left or config.moving_right or config.moving_up or config.moving_down
-        thruster_vfx.update(is_moving, scroll_speed)
-
-        # black Hole and Quark star (only if enabled for this level)
-        if level_config['blackholes_enabled'] and random.random() < 0.00125:
-            bh = BlackHole()
-            blackholes_group.add(bh)
-        # blackhole and quark group maps for gravity effects
-        groups_map = {
-            'player': player,
-            'enemy_group': enemy_group,
-            'asteroids': asteroid_group,
-            'player_lasers': player_lasers ,
-            'enemy_lasers': enemy_lasers,
-            'rockets_group': rockets_group,
-        }
-        for bh in list(blackholes_group):
-            bh.update(groups_map)
-            bh.draw(config.game_window)
-
-
-        # __ Explosions for death __
-        for exp in explosion_group:
-            explosion_group.update()
-            exp.draw(config.game_window)
-
-        for rocket in rockets_group:
-            rocket.update()
-            rocket.draw()
-        
-        if config.rocket and level_config['weapons']['rocket']:
-            player.shoot_rocket(enemy_group, rockets_group, asteroid_group)
-        
-        if random.random() < level_config['asteroid_spawn_rate']:
-            x = random.randint(50, config.SCREEN_WIDTH - 50)
-            asteroid = Asteroid(x, -50, scale=1.0, health=20)
-            asteroid_group.add(asteroid)
-            
-        for asteroid in asteroid_group:
-            asteroid.update(asteroid_group, player)
-            asteroid.draw(config.game_window)
-
-
-        # update and draw enemies
-        for enemy in enemy_group:
-            enemy.update_enemy(config.SCREEN_HEIGHT)
-            enemy.draw()
-            enemy.update_lasers()
-            enemy.update(player)
-            enemy.ai_shoot(player, enemy_group, asteroid_group) # ai_shooting plain laser
-            enemy.ai_shoot_heavy(player, enemy_group, asteroid_group)
-            enemy.ai_shoot_rocket(player, rockets_group, asteroid_group)
-            if enemy.character_type == "enemy4":
-                enemy.ai_shoot_laserline(player, asteroid_group=asteroid_group, laserline_group=enemy_beam_group, blackholes=blackholes_group)
-            if enemy.character_type == "enemy5":
-                enemy.ai_shoot_enemy5(player, enemy_group, asteroid_group)
-            if enemy.character_type == "enemy6":
-                enemy.ai_shoot_plasma(player, asteroid_group, plasma_group)
-            if enemy.character_type == "enemy7":  
-                enemy.ai_enemy7_shoot(player, enemy_group, asteroid_group, rockets_group, plasma_group)
-
-            
-        # enemy laserline
-        for beam in enemy_beam_group:
-            beam.update(asteroid_group, enemy_group, player, blackholes_group)
-            beam.draw(config.game_window)
-
-        # lasers
-        for laser in player_lasers:
-            laser.update()
-            laser.draw()
-        # if player shoots (only if weapon is enabled for this level)
-        if config.shooting and level_config['weapons']['laser']:
-            player.shoot_laser(
-                target_player=player,
-                target_enemy_group=enemy_group,
-                asteroid_group=asteroid_group
-            )
-        player.update_lasers()
-
-        # laserline player shooting (only if weapon is enabled for this level)
-        if level_config['weapons']['laser_line']:
-            if config.laserLine_fire: # if we are shooting
-                player_beam.trigger(True)
-            else:
-                player_beam.trigger(False)
-            player_beam.update(asteroid_group, enemy_group, player, blackholes_group)
-            player_beam.draw(config.game_window)
-
-        # plasma shot (only if weapon is enabled for this level)
-        if config.plasma_shooting and level_config['weapons']['plasma']:
-            player.shoot_plasma(enemy_group, asteroid_group, rockets_group)
-        for plasma in plasma_group:
-            plasma.update()
-            plasma.draw()
-
-        # ice bullets (only if weapon is enabled for this level)
-        if config.ice_shooting and level_config['weapons']['ice']:
-            player.shoot_ice(enemy_group, ice_bullets)
-        for ice in ice_bullets[:]:
-            ice.update()
-            ice.draw(config.game_window)
-            if not ice.active:
-                ice_bullets.remove(ice)
-
-        # heavy laser (only if weapon is enabled for this level)
-        heavyLaser_group.draw(config.game_window)
-        heavyLaser_group.update()
-        
-        if getattr(config, "heavy_shooting", False) and level_config['weapons']['heavy_laser']:
-            player.shoot_heavy(
-                target_player=player,
-                target_enemy_group=enemy_group,
-                asteroid_group=asteroid_group
-            )
-
-        # check for death after blackhole updates (blackholes can instantly kill player)
-        if player.health <= 0:
-            print("You died, health is: ", player.health, ", with a score of:", config.score)
-            
-            mission_complete = config.score >= config.target_score
-            outcome_color = "green" if mission_complete else "red"
-            
-            transition = LevelTransition(config.game_window, outcome_color=outcome_color)
-            return "death_transition"
-            
-        thruster_vfx.draw(config.game_window)
-        
-        player.draw()
-        player.update(player)
-
-        
-        # movement 
-        player.movement(config.moving_left, config.moving_right, config.moving_up, config.moving_down)
-
-
-        # ___ UI ____
-        # health
-        health_bar.draw(player.health, shield=False)
-        menu.drawText(f'Health:', config.font, config.WHITE, 10, 790)
-        # shield
-        shield_bar.draw(player.shield, shield=True)
-        menu.drawText(f'Shield:', config.font, config.WHITE, 10, 810)
-        # score
-        menu.drawText(f'Score: {config.score} / {config.target_score}', config.font, config.WHITE, 10, 830)
-        # wave count
-        menu.drawText(f'Waves: {wave_count}', config.font, config.RED, 10, 870)
-
-
-        if getattr(config, "motherShip_boss_active", False):
-            boss_present = any(e.character_type == "enemy8" for e in enemy_group) # keep track if there is a carrier mothership in the group(exist)
-            if boss_present:
-                config.motherShip_boss_active = True
-            # Only clear the flag if it was active and there are NO boss enemies left
-            elif not boss_present and config.mothership_wave < wave_count : # if now carrier boss and we are in diffrent wave than boss spawn wave
-                config.motherShip_boss_active = False
-        
-
-        # music switching logic
-        if not is_paused:
-            if not pygame.mixer.music.get_busy(): # check if song is still playing
-                if current_song == 'song1':
-                    current_song = 'song2'
-                    play_music(song1_path)
-                elif current_song == 'song2':
-                    current_song = 'song3'
-                    play_music(song2_path)
-                else:
-                    current_song = 'song1'
-                    play_music(song1_path)
-            
-
-        # Run garbage collector here to clean old object where it can
-        gc.enable()
-        gc.collect(True) 
-
-        # events
+    while playing:
+        prof.begin_frame()
+        if max_steps is None:
+            frame_ms = config.frameRate.tick(config.FPS) # get time and frame rate (loop rate)
+            step_accumulator += min(frame_ms, sim_clock.STEP_MS * sim_clock.MAX_STEPS_PER_FRAME)
+        elif step_count >= max_steps:
+            return "menu"
+        else:
+            step_accumulator = sim_clock.STEP_MS # unthrottled, one step per loop
+
+        # events (input state is sampled once per rendered frame)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 playing = False
@@ -405,6 +262,7 @@ def start_game(level_number=2):
                 if event.key == pygame.K_w: config.laserLine_fire = True
                 if event.key == pygame.K_q: config.plasma_shooting = True
                 if event.key == pygame.K_e: config.ice_shooting = True
+                if event.key == profiler.TOGGLE_KEY: prof.toggle()
                 
                 if event.key == pygame.K_ESCAPE: 
                     return "menu"
@@ -420,10 +278,153 @@ def start_game(level_number=2):
                 if event.key == pygame.K_w: config.laserLine_fire = False
                 if event.key == pygame.K_q: config.plasma_shooting = False
                 if event.key == pygame.K_e: config.ice_shooting = False
+        prof.lap('events')
+
+
+        # ____ Simulation (fixed steps) ____
+        while step_accumulator >= sim_clock.STEP_MS:
+            step_accumulator -= sim_clock.STEP_MS
+            sim_clock.advance()
+            ctx.begin_step(step_count)
+            now = ctx.now
+            if input_script is not None:
+                input_state = input_script(step_count)
+                if input_state:
+                    apply_input_state(input_state)
+            if recorder is not None:
+                recorder.record()
+            step_count += 1
+
+            if player.health <= 0:
+                print("You died, health is: ", player.health, ", with a score of:", config.score)
+                
+                mission_complete = config.score >= config.target_score
+                outcome_color = "green" if mission_complete else "red"
+                
+                global transition
+                capture_death_snapshot()
+                transition = LevelTransition(config.game_window, outcome_color=outcome_color)
+                gc_policy.collect_at_safe_point("death_transition")
+                return "death_transition"
+            
+            # live entity counts for this step's spawn budget
+            spawn_budget.begin_step(enemy_group, asteroid_group, blackholes_group)
+
+            config.scroll_state['y'] += scroll_speed # background scroll, wrapped when drawn
+            star_vfx.update()
+            prof.lap('star_vfx')
+
+            comet_spawn_timer += 1
+            if comet_spawn_timer > comet_spawn_interval:
+                comets.append(Comet(config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+                comet_spawn_timer = 0
+            for comet in comets:
+                comet.update(scroll_speed)
+            prof.lap('comets')
+
+            is_moving = config.moving_left or config.moving_right or config.moving_up or config.moving_down
+            thruster_vfx.update(is_moving, scroll_speed, ctx.now)
+            prof.lap('thruster')
+
+            # black Hole and Quark star (only if enabled for this level)
+            if level_config['blackholes_enabled'] and ctx.rng.random() < 0.00125 and spawn_budget.allow('blackhole'):
+                bh = BlackHole()
+                blackholes_group.add(bh)
+            # gravity on the player and the context's gravity groups
+            for bh in list(blackholes_group):
+                bh.update(ctx)
+            prof.lap('black_holes')
+
+            # collision grid for this step (after black hole gravity moved everything)
+            rebuild_spatial_index()
+            prof.lap('collision_grid')
+
+            # __ Explosions for death __
+            explosion_group.update(ctx)
+            prof.lap('explosions')
+
+            if config.rocket and level_config['weapons']['rocket']:
+                player.shoot_rocket(ctx, enemy_group)
+            prof.lap('rockets')
+            
+            if ctx.rng.random() < level_config['asteroid_spawn_rate'] and spawn_budget.allow('asteroid'):
+                x = ctx.rng.randint(50, config.SCREEN_WIDTH - 50)
+                asteroid = Asteroid.acquire(x, -50, scale=1.0, health=20)
+                asteroid_group.add(asteroid)
+                
+            for asteroid in asteroid_group:
+                asteroid.update(ctx)
+            prof.lap('asteroids')
+
+            # update enemies
+            # enemy movement and per type behaviours (perception is time sliced)
+            ai_scheduler.update(ctx)
+            prof.lap('enemy_ai')
+
+            # enemy laserline
+            for beam in enemy_beam_group:
+                beam.update(ctx)
+            prof.lap('beams')
+
+            # every projectile in flight, whoever shot it (one pass per kind)
+            projectile_manager.update(ctx)
+            prof.lap('projectiles')
+
+            # if player shoots (only if weapon is enabled for this level)
+            if config.shooting and level_config['weapons']['laser']:
+                player.shoot_laser(ctx)
+
+            # laserline player shooting (only if weapon is enabled for this level)
+            if level_config['weapons']['laser_line']:
+                if config.laserLine_fire: # if we are shooting
+                    player_beam.trigger(True)
+                else:
+                    player_beam.trigger(False)
+                player_beam.update(ctx)
+            prof.lap('beams')
+
+            # plasma shot (only if weapon is enabled for this level)
+            if config.plasma_shooting and level_config['weapons']['plasma']:
+                player.shoot_plasma(ctx)
+
+            # ice bullets (only if weapon is enabled for this level)
+            if config.ice_shooting and level_config['weapons']['ice']:
+                player.shoot_ice(ctx)
+
+            # heavy laser (only if weapon is enabled for this level)
+            if getattr(config, "heavy_shooting", False) and level_config['weapons']['heavy_laser']:
+                player.shoot_heavy(ctx)
+            prof.lap('player_weapons')
+
+            # check for death after blackhole updates (blackholes can instantly kill player)
+            if player.health <= 0:
+                print("You died, health is: ", player.health, ", with a score of:", config.score)
                 
- 
+                mission_complete = config.score >= config.target_score
+                outcome_color = "green" if mission_complete else "red"
+                
+                capture_death_snapshot()
+                transition = LevelTransition(config.game_window, outcome_color=outcome_color)
+                gc_policy.collect_at_safe_point("death_transition")
+                return "death_transition"
+
+            player.update(ctx)
+
+            # movement 
+            player.movement(config.moving_left, config.moving_right, config.moving_up, config.moving_down)
+            prof.lap('player')
+
+            if getattr(config, "motherShip_boss_active", False):
+                boss_present = entity_registry.count(enemy_group, "enemy8") > 0 # keep track if there is a carrier mothership in the group(exist)
+                if boss_present:
+                    config.motherShip_boss_active = True
+                # Only clear the flag if it was active and there are NO boss enemies left
+                elif not boss_present and config.mothership_wave < wave_count : # if now carrier boss and we are in diffrent wave than boss spawn wave
+                    config.motherShip_boss_active = False
+
             # _______ Spawn enemy waves ________
-            if event.type == SPAWN_EVENT: # 12s
+            if now >= next_wave_time: # 12s
+                next_wave_time += spawn_interval
                 # if next wave is a mothership (only if enabled for this level)
                 if (level_config['mothership_enabled'] and 
                     not getattr(config, "motherShip_boss_active", False) and 
@@ -440,125 +441,213 @@ def start_game(level_number=2):
                     enemies_to_spawn = wave_count * level_config['wave_size_multiplier']
                     pending_spawns = enemies_to_spawn
                     wave_count += 1          # next wave is 1 larger
-                    spawn_enemy(level_config)
-                    pending_spawns -= 1          # we spawned one so less pending now
+                    if spawn_enemy(level_config):
+                        pending_spawns -= 1      # we spawned one so less pending now
                     if pending_spawns > 0:
-                        pygame.time.set_timer(SPAWN_SINGLE_EVENT, 1000) # 100ms delay between enemies
+                        next_single_spawn_time = now + stagger_interval
                     
             # _____ Stagger enemy spawns _____
-            if event.type == SPAWN_SINGLE_EVENT:
-                spawn_enemy(level_config) # create enemy
-                pending_spawns -= 1
+            if next_single_spawn_time is not None and now >= next_single_spawn_time:
+                if spawn_enemy(level_config): # create enemy (retried next interval when over budget)
+                    pending_spawns -= 1
                 if pending_spawns <= 0:
-                    pygame.time.set_timer(SPAWN_SINGLE_EVENT, 0) # stop stagger timer
+                    next_single_spawn_time = None # stop stagger timer
+                else:
+                    next_single_spawn_time += stagger_interval
+            prof.lap('spawns')
+
+
+        if not render:
+            prof.end_frame()
+            continue
+
+        # ____ Render (once per loop, from the latest simulation state) ____
+        # the play field draws into internal_surface (render scale), the HUD and overlays onto game_window
+        level_background.draw(config.internal_surface, config.scroll_state) # covers the whole window, no clear needed
+        prof.lap('background')
+        star_vfx.draw(config.internal_surface)
+        prof.lap('star_vfx')
+
+        for comet in comets:
+            comet.draw(config.internal_surface)
+        prof.lap('comets')
+
+        # sprites go through the render queue, one blits call per layer
+        render_queue.submit_sprites('black_holes', blackholes_group)
+        render_queue.flush(config.internal_surface, 'black_holes')
+        prof.lap('black_holes')
+
+        render_queue.submit_sprites('explosions', explosion_group)
+        render_queue.flush(config.internal_surface, 'explosions')
+        prof.lap('explosions')
+
+        projectile_manager.draw_rockets(config.internal_surface)
+        prof.lap('rockets')
+
+        render_queue.submit_sprites('asteroids', asteroid_group)
+        render_queue.flush(config.internal_surface, 'asteroids')
+        prof.lap('asteroids')
+
+        # every enemy followed by its own lasers, shots of enemies that died after the last enemy
+        shots = projectile_manager.laser_items()
+        player_shots = shots.pop(player, ())
+        for enemy in enemy_group:
+            render_queue.submit('enemies', enemy.frame_image(), enemy.rect)
+            render_queue.extend('enemies', shots.pop(enemy, ()))
+        for items in shots.values():
+            render_queue.extend('enemies', items)
+        render_queue.flush(config.internal_surface, 'enemies')
+        prof.lap('enemy_draw')
+
+        for beam in enemy_beam_group:
+            beam.draw(config.internal_surface)
+        prof.lap('beams')
+
+        # player lasers below the player beam, plasma and ice above it
+        render_queue.extend('player_shots', player_shots)
+        render_queue.flush(config.internal_surface, 'player_shots')
+        prof.lap('projectiles')
+        if level_config['weapons']['laser_line']:
+            player_beam.draw(config.internal_surface)
+        prof.lap('beams')
+        projectile_manager.draw(config.internal_surface)
+        prof.lap('projectiles')
             
+        thruster_vfx.draw(config.internal_surface)
+        prof.lap('thruster')
+        render_queue.submit('player', player.frame_image(), player.rect)
+        render_queue.flush(config.internal_surface, 'player')
+        prof.lap('player')
+
+        config.present_play_field() # one upscale when the render scale is below 1.0
+        prof.lap('upscale')
+
+
+        # ___ UI ____
+        # health, shield, score and wave count (one cached layer, recomposed only when a value changes)
+        hud.draw(config.game_window, player.health, player.shield, config.score, config.target_score, wave_count)
+
+        if prof.enabled:
+            counts = {**entity_counts(), **{f'blits_{layer}': n for layer, n in render_queue.counts().items()}}
+            counts['ai_perception_checks'] = ai_scheduler.perception_checks # since level start
+            counts['hud_recomposes'] = hud.recomposes
+            prof.draw(config.game_window, counts)
+        prof.lap('hud')
+        
+
+        # music switching logic
+        if not is_paused:
+            if not pygame.mixer.music.get_busy(): # check if song is still playing
+                if current_song == 'song1':
+                    current_song = 'song2'
+                    play_music(song1_path)
+                elif current_song == 'song2':
+                    current_song = 'song3'
+                    play_music(song2_path)
+                else:
+                    current_song = 'song1'
+                    play_music(song1_path)
                             
         pygame.display.update()
+        prof.lap('display_update')
+        prof.end_frame()
 
     return "menu"
 
 
 # # Main Loop Controller
 transition = None #
-game_state = "menu"
 current_level = 2
 
-while game_state != "exit":
-    if game_state == "menu":
-        config.channel_8.stop()
-        config.channel_7.stop()
-        pygame.event.clear()
-        game_state = menu.menu_screen()
-        pygame.event.clear()
-
-    elif game_state == "play":
-        game_state = start_game(current_level)
-
-    elif game_state == "level_select":
-        pygame.event.clear()
-        selected_level = menu.level_select()
-        if isinstance(selected_level, int):
-            current_level = selected_level
-            transition = Transition(config.game_window) 
-            game_state = "transition_in" 
-        elif selected_level == "menu":
-            game_state = "menu"
-    # fade in
-    elif game_state == "transition_in":
-        level_config = get_level_config(current_level)
-        level_background_list = load_background_images(level_config)
-        is_running = transition.warp_in()
-        config.game_window.fill(config.BLACK)
-        draw_scrolling_bg(config.game_window, level_background_list, config.scroll_state, speed=0)
-
-        transition.draw()
+
+def run():
+    global transition, current_level, level_background, death_snapshot
+
+    # Play initial song on start
+    play_music(song1_path)
+
+    gc_policy.configure()
+    game_state = "menu"
+
+    while game_state != "exit":
+        if game_state == "menu":
+            config.channel_8.stop()
+            config.channel_7.stop()
+            gc_policy.collect_at_safe_point("menu")
+            pygame.event.clear()
+            game_state = menu.menu_screen()
+            pygame.event.clear()
+
+        elif game_state == "play":
+            if config.RECORD_PATH:
+                recorder = replay.Recorder()
+                game_state = start_game(current_level, recorder=recorder)
+                recorder.save(config.RECORD_PATH)
+                print(f"Recorded {recorder.steps} steps (seed {recorder.seed}) to {config.RECORD_PATH}")
+            else:
+                game_state = start_game(current_level)
+
+        elif game_state == "level_select":
+            pygame.event.clear()
+            selected_level = menu.level_select()
+            if isinstance(selected_level, int):
+                current_level = selected_level
+                transition = Transition(config.game_window) 
+                gc_policy.collect_at_safe_point("level_transition")
+                game_state = "transition_in" 
+            elif selected_level == "menu":
+                game_state = "menu"
+        # fade in
+        elif game_state == "transition_in":
+            level_background = background_store.get_background(current_level)
+            is_running = transition.warp_in()
+            level_background.draw(config.internal_surface, config.scroll_state)
+            config.present_play_field()
+
+            transition.draw()
         
-        pygame.display.update()
-        config.frameRate.tick(config.FPS)
+            pygame.display.update()
+            config.frameRate.tick(config.FPS)
         
-        if not is_running:
-            game_state = "play"
-            transition = None
+            if not is_running:
+                game_state = "play"
+                transition = None
     
-    elif game_state == "death_transition":
-        config.frameRate.tick(config.FPS)
-        
-        # Draw the Background (Bottom Layer)
-        draw_scrolling_bg(config.game_window, level_background_list, config.scroll_state, speed=0) 
-        
-        # Draw all Game Objects (Middle Layers) in the correct order
-        star_vfx.draw(config.game_window)
-        thruster_vfx.draw(config.game_window)
-
-        # Draw Sprite Groups (The final explosion/laser frame)
-        blackholes_group.draw(config.game_window)
-        explosion_group.draw(config.game_window)
-        rockets_group.draw(config.game_window)
-        asteroid_group.draw(config.game_window)
-        enemy_group.draw(config.game_window)
-        for beam in enemy_beam_group:
-            beam.draw(config.game_window)
-        
-        player_lasers.draw(config.game_window)
-        plasma_group.draw(config.game_window)
-        heavyLaser_group.draw(config.game_window)
-        
-        # Draw the Player (where it died)
-        player.draw() 
-        
-        # Draw the UI (On top of game action)
-        health_bar.draw(player.health, shield=False)
-        menu.drawText(f'Health:', config.font, config.WHITE, 10, 790)
-        shield_bar.draw(player.shield, shield=True)
-        menu.drawText(f'Shield:', config.font, config.WHITE, 10, 810)
-        menu.drawText(f'Score: {config.score} / {config.target_score}', config.font, config.WHITE, 10, 830)
-        menu.drawText(f'Waves: {wave_count}', config.font, config.RED, 10, 870) 
+        elif game_state == "death_transition":
+            config.frameRate.tick(config.FPS)
         
+            # final play frame (captured once when the player died)
+            config.game_window.blit(death_snapshot, (0, 0))
         
-        # Run and Draw the Transition (TOP LAYER)
-        is_running = transition.warp_out() 
-        transition.draw() 
+            # Run and Draw the Transition (TOP LAYER)
+            is_running = transition.warp_out() 
+            transition.draw() 
         
-        pygame.display.update()
+            pygame.display.update()
         
-        if not is_running:
-            transition.reset_to_max() 
-            game_state = "result_transition_in"
+            if not is_running:
+                transition.reset_to_max() 
+                death_snapshot = None
+                game_state = "result_transition_in"
     
-    elif game_state == "result_transition_in":
-        config.frameRate.tick(config.FPS)
+        elif game_state == "result_transition_in":
+            config.frameRate.tick(config.FPS)
         
-        config.game_window.fill(config.BLACK) 
-        is_running = transition.warp_in()
-        transition.draw()
+            config.game_window.fill(config.BLACK) 
+            is_running = transition.warp_in()
+            transition.draw()
         
-        pygame.display.update()
+            pygame.display.update()
         
-        if not is_running:
-            transition = None
-            game_state = "result_screen"
+            if not is_running:
+                transition = None
+                game_state = "result_screen"
             
-    elif game_state == "result_screen":
-        game_state = menu.result_screen()
+        elif game_state == "result_screen":
+            game_state = menu.result_screen()
+
+    pygame.quit()
+
 
-pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,108 @@
+# Typed object pools for short lived game objects
+#  - one pool per class, Cls.acquire(...) takes a dead object and calls reset(...) on it (or builds a new one)
+#  - kill() (or release() for objects that are not sprites) returns the object to its pool
+#  - a double kill only returns the object once, objects that were not acquired from a pool are left alone
+#  - high water marks show how many objects of each type were alive at the same time
+
+MAX_FREE = 1024 # free objects kept per pool, a burst above this is left to the garbage collector
+
+# attributes other systems attach to pooled sprites, cleared on release (black hole float position)
+STALE_ATTRS = ('bh_pos',)
+
+
+class ObjectPool:
+    def __init__(self, cls, max_free=MAX_FREE):
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.double_releases = 0
+        self.high_water = 0
+
+
+    @property
+    def in_use(self):
+        return self.created + self.reused - self.released
+
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        obj._pool_free = False
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+
+    def release(self, obj):
+        state = getattr(obj, '_pool_free', None)
+        if state is None: # built directly, not from this pool
+            return
+        if state:
+            self.double_releases += 1
+            return
+        obj._pool_free = True
+        self.released += 1
+        for attr in STALE_ATTRS:
+            obj.__dict__.pop(attr, None)
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+
+    def stats(self):
+        return {
+            'in_use': self.in_use,
+            'free': len(self.free),
+            'high_water': self.high_water,
+            'created': self.created,
+            'reused': self.reused,
+            'double_releases': self.double_releases,
+        }
+
+
+
+_pools = {}
+
+
+def pool_for(cls):
+    pool = _pools.get(cls)
+    if pool is None:
+        pool = _pools[cls] = ObjectPool(cls)
+    return pool
+
+
+def stats():
+    """Per class pool counters, e.g. {'Rocket': {'in_use': 3, 'high_water': 12, ...}}"""
+    return {cls.__name__: pool.stats() for cls, pool in _pools.items()}
+
+
+def release_groups(groups):
+    """Return the pooled sprites of groups that are about to be emptied (they are never killed)"""
+    for group in groups:
+        for sprite in group:
+            if isinstance(sprite, Pooled):
+                sprite.release()
+
+
+
+class Pooled:
+    """Mixin for pooled classes, the class implements reset() with the same arguments as __init__"""
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        return pool_for(cls).acquire(*args, **kwargs)
+
+
+    def release(self):
+        pool_for(type(self)).release(self)
+
+
+    def kill(self):
+        super().kill()
+        self.release()
@@ -0,0 +1,119 @@
+import pygame # type: ignore
+import time
+from collections import deque
+
+import config
+import gc_policy
+
+
+# Per subsystem frame time profiler (toggle the overlay with F3 in game)
+#  - the play loop calls lap(stage) after each stage, the time since the last lap is added to that stage
+#  - a stage can be lapped more than once per frame (simulation and render part), the times add up
+#  - when the overlay is off every call returns straight away, so the cost is one method call per stage
+#  - every lapped stage has to be listed in STAGES, end_frame only keeps the listed ones
+
+TOGGLE_KEY = pygame.K_F3
+WINDOW = 120 # frames in the rolling window
+
+STAGES = (
+    'events', 'background', 'star_vfx', 'comets', 'thruster', 'black_holes', 'collision_grid',
+    'explosions', 'rockets', 'asteroids', 'enemy_ai', 'enemy_draw', 'beams', 'projectiles', 'player_weapons', 'player',
+    'spawns', 'upscale', 'hud', 'display_update',
+)
+
+
+class FrameProfiler:
+    def __init__(self, window=WINDOW):
+        self.enabled = False
+        self.window = window
+        self.samples = {stage: deque(maxlen=window) for stage in STAGES}
+        self.frame_samples = deque(maxlen=window)
+        self.current = {}
+        self.frame_start = 0.0
+        self.last = 0.0
+        self.panel = None
+
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.reset()
+
+
+    def reset(self):
+        for samples in self.samples.values():
+            samples.clear()
+        self.frame_samples.clear()
+        self.current = {}
+
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start = self.last = time.perf_counter()
+        self.current = {}
+
+
+    def lap(self, stage):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[stage] = self.current.get(stage, 0.0) + (now - self.last)
+        self.last = now
+
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        for stage, samples in self.samples.items():
+            samples.append(self.current.get(stage, 0.0) * 1000)
+        self.frame_samples.append((time.perf_counter() - self.frame_start) * 1000)
+
+
+    def stats(self):
+        """Rolling mean/p95/max in ms per stage, plus 'frame' for the whole loop"""
+        result = {}
+        for stage, samples in list(self.samples.items()) + [('frame', self.frame_samples)]:
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[stage] = {
+                'mean': sum(ordered) / len(ordered),
+                'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                'max': ordered[-1],
+            }
+        return result
+
+
+    def draw(self, surface, entity_counts):
+        """Overlay with one line per stage, the gc pauses (mean, count, max) and the entity counts"""
+        if not self.enabled:
+            return
+        font = config.font
+        lines = [('stage              mean    p95    max (ms)', config.CAYAN)]
+        for stage, s in self.stats().items():
+            colour = config.RED if s['p95'] > 1000 / config.FPS else config.WHITE
+            lines.append((f"{stage:<18}{s['mean']:6.2f} {s['p95']:6.2f} {s['max']:6.2f}", colour))
+        pauses = gc_policy.pause_stats()
+        if pauses:
+            lines.append(('gc pauses          mean  count    max (ms)', config.CAYAN))
+        for generation, s in sorted(pauses.items()):
+            lines.append((f"gen{generation:<15}{s['mean_ms']:6.2f} {s['count']:6d} {s['max_ms']:6.2f}", config.WHITE))
+        lines.append(('', config.WHITE))
+        counts = [f'{name}: {count}' for name, count in entity_counts.items()]
+        for i in range(0, len(counts), 4):
+            lines.append(('  '.join(counts[i:i + 4]), config.GREEN))
+
+        line_height = font.get_linesize()
+        width = 720
+        height = line_height * len(lines) + 16
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.panel.fill((0, 0, 0, 170))
+        for i, (text, colour) in enumerate(lines):
+            self.panel.blit(font.render(text, True, colour), (8, 8 + i * line_height))
+        surface.blit(self.panel, (surface.get_width() - width - 10, 10))
+
+
+
+# profiler shared by the play loop
+frame_profiler = FrameProfiler()
@@ -0,0 +1,90 @@
+import object_pool
+import sprite_groups
+from laser_engine import lasers as laser_engine
+from render_queue import render_queue
+
+
+# Projectile manager, owns every projectile in flight by kind
+#  - lasers and heavy lasers: numpy arrays in laser_engine
+#  - rockets and plasma: one shared sprite group per kind (the collision grid sees them, black holes pull rockets)
+#  - ice bullets: one list (they are not sprites)
+#  - shooters only hand new projectiles over, a dead shooter's shots keep flying
+#  - one update pass for every kind, rockets are drawn below asteroids and enemies ('rockets' render layer),
+#    lasers are handed to the play loop grouped by shooter (each enemy's shots are drawn right after it, the player's
+#    below the player beam), plasma above them ('projectiles' render layer) with the ice bullets on top
+
+
+class ProjectileManager:
+    def __init__(self):
+        self.lasers = laser_engine
+        self.rockets = sprite_groups.rockets_group
+        self.plasma = sprite_groups.plasma_group
+        self.ice = []
+
+
+    def clear(self):
+        """Drop every projectile (pooled ones go back to their pool)"""
+        self.lasers.clear()
+        object_pool.release_groups((self.rockets, self.plasma))
+        self.rockets.empty()
+        self.plasma.empty()
+        for ice in self.ice:
+            ice.release()
+        self.ice.clear()
+
+
+    def add_ice(self, bullet):
+        self.ice.append(bullet)
+
+
+    def update(self, ctx):
+        """Move every projectile one simulation step and resolve its hits"""
+        for rocket in self.rockets:
+            rocket.update(ctx)
+
+        self.lasers.step(ctx.player, ctx.enemies, ctx.asteroids, ctx.blackholes)
+
+        for plasma in self.plasma:
+            plasma.update(ctx)
+
+        # ice bullets are compacted in place, spent ones go back to the pool
+        live = 0
+        for ice in self.ice:
+            ice.update(ctx)
+            if ice.active:
+                self.ice[live] = ice
+                live += 1
+            else:
+                ice.release()
+        del self.ice[live:]
+
+
+    def draw_rockets(self, surface):
+        render_queue.submit_sprites('rockets', self.rockets)
+        render_queue.flush(surface, 'rockets')
+
+
+    def laser_items(self):
+        """{shooter: [(image, topleft), ...]} of the lasers in flight, the play loop puts them in the enemy and player shot layers"""
+        return self.lasers.draw_items()
+
+
+    def draw(self, surface):
+        render_queue.submit_sprites('projectiles', self.plasma)
+        render_queue.flush(surface, 'projectiles')
+        for ice in self.ice: # polygons, drawn above the blitted projectiles
+            ice.draw(surface)
+
+
+    def counts(self):
+        """Number of live projectiles per kind"""
+        counts = self.lasers.counts()
+        counts['rockets'] = len(self.rockets)
+        counts['plasma'] = len(self.plasma)
+        counts['ice_bullets'] = len(self.ice)
+        return counts
+
+
+
+# manager shared by every shooter
+projectiles = ProjectileManager()
@@ -1,8 +1,13 @@
 import pygame # type: ignore
-import os, random
 
 import config
+import sim_clock
+import rng
 import sprite_groups
+import asset_cache
+from spatial_hash import grid
+from object_pool import Pooled
+from entity_registry import registry
 
 
 
@@ -14,7 +19,7 @@ def apply_damage(entity, dmg, damage_type="normal"):
        - Different enemies have shield and health values
        - Plasma does more damage to the shields
     """
-    if hasattr(entity, "character_type") and hasattr(entity, "shield") :
+    if registry.has(entity, "shield"):
     
         shield = getattr(entity, "shield", 0)
         
@@ -36,151 +41,24 @@ def apply_damage(entity, dmg, damage_type="normal"):
 
 
 
-class Laser(pygame.sprite.Sprite):
-    def __init__(self, shooter, player, enemy_group, asteroid_group, damage=10, velocity=12):
-        super().__init__()
-        self.shooter = shooter
-        self.player = player
-        self.enemy_group = enemy_group
-        self.damage = damage
-        self.velocity = velocity
-        self.asteroid_group = asteroid_group
-        
-        # load the image
-        self.image = pygame.image.load("img/laser/laser.png").convert_alpha()
-        
-        # direction and start Rect
-        if shooter.character_type.startswith("enemy"):
-            self.image = pygame.transform.flip(self.image, False, True) # Enemy shoots from top downs so need to flip in y
-            self.direction = 1
-            self.rect = self.image.get_rect(midtop=shooter.rect.midbottom)
-        else:
-            self.direction = -1 # player shoots up
-            self.rect = self.image.get_rect(midbottom=shooter.rect.midtop)
-        
-        self.prev_center = pygame.math.Vector2(self.rect.center)
-            
-            
-    # laser update method
-    def update(self):
-        # black hole and quark star
-        prev = pygame.math.Vector2(self.prev_center)
-        move_vector = pygame.math.Vector2(0, self.velocity * self.direction)
-        current = prev + move_vector
-        
-        # check black holes and quar stars collision by testing segment prev vs current against each bh/qs rect
-        bh_group = getattr(sprite_groups, 'blackholes_group', None)
-        if bh_group:
-            # iterate copy to be safe
-            for bh in list(bh_group):
-                try:
-                    # clipline returns a clipped segment if intersects 
-                    if bh.rect.clipline(int(prev.x), int(prev.y), int(current.x), int(current.y)):
-                        # collided with BH or QS along the travel path / destroy or absorb shots
-                        try:
-                            self.kill()
-                        except Exception:
-                            pass
-                            print(" Black hole could not kill laser object")
-                        # skip update for killed laser
-                        return
-                except Exception:
-                    # fallback if clipline fails, we try basic rect check at current po
-                    if bh.rect.colliderect(pygame.Rect(int(current.x - self.rect.width/2),
-                        int(current.y - self.rect.height/2),
-                        self.rect.width,
-                        self.rect.height)):
-                        try: # try killing object
-                            self.kill()    
-                        except Exception:
-                            pass
-                        return
-        
-        # move laser
-        self.rect.center = (int(current.x), int(current.y))
-        # store for next frame
-        self.prev_center = pygame.math.Vector2(self.rect.center)
-        
-        # remove if laser goes of screen in y
-        if self.rect.bottom < 0 or self.rect.top > config.SCREEN_HEIGHT:
-            self.kill()
-            return
-        
-        # Enemy shot laser: damage player
-        if self.shooter.character_type.startswith("enemy"):
-            if self.player and self.rect.colliderect(self.player.rect):
-                apply_damage(self.player, self.damage)
-                self.kill()
-                return
-            
-        else:
-            # if player has shot
-            for enemy in self.enemy_group:
-                if self.rect.colliderect(enemy.rect):
-                    apply_damage(enemy, self.damage)
-                    self.kill()
-                    return
-                
-            # asteroid hit
-            for asteroid in self.asteroid_group:
-                if self.rect.colliderect(asteroid.rect):
-                    asteroid.health -= self.damage
-                    self.kill()
-                    return  
-
-
-    # draw laser
-    def draw(self):
-        config.game_window.blit(self.image, self.rect)
-
-
-
-class HeavyLaser(Laser):
-    def __init__(self, shooter, player, enemy_group, asteroid_group, damage=50, velocity=8, image_path="img/heavyLaser/heavylaser.png", size=(18,45)):
-        
-        # initialize base laser class 
-        super().__init__(shooter, player, enemy_group, asteroid_group, damage=damage, velocity=velocity)
-        
-        # OVERRIDE DAMAGE AND SPEED FOR ENEMIES
-        if shooter.character_type.startswith("enemy"):
-            self.damage = 10 # enemy does 10% health damage or shield damage
-            self.velocity = 6
-        else:
-            self.damage = damage # keep default damage for player
-            self.velocity = 14
-            
-        # load images and scale heavy laser
-        img = pygame.image.load(image_path).convert_alpha()
-        img = pygame.transform.scale(img, size)
-        
-        if shooter.character_type.startswith("enemy"):
-            img = pygame.transform.flip(img, False, True) # enemy looks down so we flip laser
-            self.rect = img.get_rect(midtop=shooter.rect.midbottom)
-            self.direction = 1 # facing towards screen bottom
-        else:
-            self.rect = img.get_rect(midbottom=shooter.rect.midtop)
-            self.direction = -1 # facing top screen
-            
-        self.image = img
-
-        # reset prev center after reassigning rect
-        self.prev_center = pygame.math.Vector2(self.rect.center)
+# straight line shots (laser and heavy laser) live in laser_engine.py
 
 
 
-# rocket class
-class Rocket(pygame.sprite.Sprite):
+# rocket class (pooled, create with Rocket.acquire)
+class Rocket(Pooled, pygame.sprite.Sprite):
     def __init__(self, shooter, target_group, asteroid_group):
         super().__init__()
+        self.reset(shooter, target_group, asteroid_group)
 
+
+    def reset(self, shooter, target_group, asteroid_group):
         self.shooter = shooter
         self.damage = 50 if self.shooter.character_type.startswith("enemy") else 200
-        self.rocket_images = []
-        self.explosion_images = []
         # state
         self.exploding = False
         self.frame_index = 0
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = sim_clock.get_ticks()
         self.frame_rate = 100 # ms per frame
         
         # References
@@ -194,23 +72,15 @@ class Rocket(pygame.sprite.Sprite):
         else:
             rocket_folder = "img/mushroomRocket"
         
-        for filename in sorted(os.listdir(rocket_folder)):
-            img = pygame.image.load(os.path.join(rocket_folder, filename)).convert_alpha()
-            img = pygame.transform.scale(img, (20, 50)) # scale the rocket down smaller
-            # flip rocket for enemies
-            if shooter.character_type.startswith("enemy"):
-                img = pygame.transform.flip(img, False, True)
-            self.rocket_images.append(img)
-            
-        # load explosion frames 
-        for filename in sorted(os.listdir("img/explosion")):
-            img = pygame.image.load(os.path.join("img/explosion", filename)).convert_alpha()
-            self.explosion_images.append(img)
+        # scale the rocket down smaller and flip rocket for enemies
+        flip = (False, shooter.character_type.startswith("enemy"))
+        self.rocket_images = asset_cache.get_frames(rocket_folder, size=(20, 50), flip=flip)
+        self.explosion_images = asset_cache.get_frames("img/explosion")
             
         # starts with rocket sprite
         self.image = self.rocket_images[0]
         self.rect = self.image.get_rect(center=shooter.rect.center)
-        self.original_image = self.image.copy()
+        self.original_image = self.image # shared cached frame, never drawn onto
         
         # direction enemy or player +/-
         if shooter.character_type.startswith("enemy"):
@@ -220,13 +90,13 @@ class Rocket(pygame.sprite.Sprite):
             
             
     # update method
-    def update(self):
+    def update(self, ctx):
         if not self.exploding:
             # Move
             self.rect.y += self.velocity
             
             # ___ Animate Rocket ___
-            current_time = pygame.time.get_ticks() # track time
+            current_time = ctx.now # track time
             if current_time - self.last_update > self.frame_rate:
                 self.last_update = current_time
                 self.frame_index = (self.frame_index + 1) % len(self.rocket_images)
@@ -251,22 +121,20 @@ class Rocket(pygame.sprite.Sprite):
             hit_something = False
             
             # ___ Check for enemies or player (ignore the shooter itself)
-            for target in self.target_group:
+            for target in grid.query(self.target_group, detection_area):
                 if target is self.shooter:
                     continue
-                if detection_area.colliderect(target.rect):
-                    if hasattr(target, "health"):
-                        if self.shooter.character_type.startswith("enemy"):
-                            apply_damage(target, self.damage)
-                        else: # player
-                            apply_damage(target, self.damage)
-                    hit_something = True
-            
-            for asteroid in list(self.asteroid_group):
-                if hasattr(asteroid, "rect") and detection_area.colliderect(asteroid.rect):
-                    asteroid.health -= 100
-                    asteroid.break_apart(self.asteroid_group, rocket_hit=True)
-                    hit_something = True
+                if hasattr(target, "health"):
+                    if self.shooter.character_type.startswith("enemy"):
+                        apply_damage(target, self.damage)
+                    else: # player
+                        apply_damage(target, self.damage)
+                hit_something = True
+
+            for asteroid in grid.query(self.asteroid_group, detection_area):
+                asteroid.health -= 100
+                asteroid.break_apart(self.asteroid_group, rocket_hit=True)
+                hit_something = True
                     
 
             # Trigger explosion
@@ -286,7 +154,7 @@ class Rocket(pygame.sprite.Sprite):
         else:
 
             # __ Explosion Animation __
-            current_time = pygame.time.get_ticks()
+            current_time = ctx.now
             if current_time - self.last_update > self.frame_rate:
                 self.last_update = current_time
                 self.frame_index += 1
@@ -297,10 +165,6 @@ class Rocket(pygame.sprite.Sprite):
                     self.kill()
                     
 
-    def draw(self):
-        config.game_window.blit(self.image, self.rect)
-
-
 
 # ___ laser line class ___
 class LaserLine(pygame.sprite.Sprite):
@@ -320,7 +184,7 @@ class LaserLine(pygame.sprite.Sprite):
         # Fuel system
         self.fuel = 100
         self.max_fuel = self.fuel # keep track of our fuel limit
-        self.last_fuel_update = pygame.time.get_ticks() # keep track of time
+        self.last_fuel_update = sim_clock.get_ticks() # keep track of time
         self.fuel_drain_per_sec = 20 # more than recharge
         self.fuel_recharge_per_sec = 10 # half the drain rate
         
@@ -335,9 +199,10 @@ class LaserLine(pygame.sprite.Sprite):
         
         
     # update method
-    def update(self, asteroid_group, enemy_group, player, blackholes_group):
+    def update(self, ctx):
+        asteroid_group, enemy_group, player, blackholes_group = ctx.asteroids, ctx.enemies, ctx.player, ctx.blackholes
         # track time in now
-        now = pygame.time.get_ticks()
+        now = ctx.now
         delta = (now - self.last_fuel_update) / 1000
         self.last_fuel_update = now # reset time to start tracking event(next) again
 
@@ -370,8 +235,8 @@ class LaserLine(pygame.sprite.Sprite):
         if self.active:
             x = self.character.rect.centerx
             y = self.character.rect.top if self.is_player else self.character.rect.bottom # if player, shoot from top rect upwards; if ai, shoot from bottom rect downwards
-            color = random.choice(self.color_player if self.is_player else self.color_ai)
-            length = random.randint(30, 50)
+            color = rng.vfx.choice(self.color_player if self.is_player else self.color_ai)
+            length = ctx.rng.randint(30, 50) # sets the hit rect, so it comes from the gameplay stream
             self.segments.append([x, y, length, color])
             
         # Move segments
@@ -386,19 +251,17 @@ class LaserLine(pygame.sprite.Sprite):
             seg_rect = pygame.Rect(seg[0]-self.width//2, seg[1], self.width, seg[2])
             hit = False
             
-            # asteroid collisions
-            for asteroid in asteroid_group:
-                if seg_rect.colliderect(asteroid.rect):
-                    asteroid.health -= 30
-                    hit = True
-                    break
+            # asteroid collisions (first asteroid only)
+            for asteroid in grid.query(asteroid_group, seg_rect):
+                asteroid.health -= 30
+                hit = True
+                break
                 
             # Enemy collision if it is the player
             if self.is_player:
-                for enemy in enemy_group:
-                    if seg_rect.colliderect(enemy.rect):
-                        apply_damage(enemy, 3)
-                        hit = True
+                for enemy in grid.query(enemy_group, seg_rect):
+                    apply_damage(enemy, 3)
+                    hit = True
                         
             else: # if enemy shoots
                 # ai laser hitting the player
@@ -410,10 +273,8 @@ class LaserLine(pygame.sprite.Sprite):
                 
         
             # Blackhole/quarkstar collision
-            for bh in blackholes_group or []:
-                if seg_rect.colliderect(bh.rect):
-                    hit = True
-                    break
+            if blackholes_group and grid.query(blackholes_group, seg_rect):
+                hit = True
 
 
             # Keep segments if it does not hit anything
@@ -434,37 +295,34 @@ class LaserLine(pygame.sprite.Sprite):
             
     
     def draw(self, surface):
+        # segments are in logical pixels, surface is the play field (render scale applies)
+        scale = config.RENDER_SCALE
+        width = max(1, round(self.width * scale))
         for seg in self.segments:
-            pygame.draw.rect(surface, seg[3], (seg[0]-self.width//2, seg[1], self.width, seg[2]))    
+            pygame.draw.rect(surface, seg[3], (int((seg[0] - self.width // 2) * scale), int(seg[1] * scale), width, int(seg[2] * scale)))    
 
 
 
 # ____ Plasma ____
-# does more damage to shields then health
-class Plasma(pygame.sprite.Sprite):
+# does more damage to shields then health (pooled, create with Plasma.acquire)
+class Plasma(Pooled, pygame.sprite.Sprite):
     def __init__(self, shooter, target_group, asteroid_group):
         super().__init__() # for parent base class Sprite internal
+        self.reset(shooter, target_group, asteroid_group)
+
+
+    def reset(self, shooter, target_group, asteroid_group):
         self.shooter = shooter
-        self.plasma_images = [] # plasma projectile images
-        self.explosion_images = [] # plasma explosion images
         self.exploding = False 
         self.frame_index = 0
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = sim_clock.get_ticks()
         self.frame_rate = 70
         self.damage_applied = False 
         
-        # load plasma images
-        for filename in sorted(os.listdir("img/plasma")):
-            img = pygame.image.load(os.path.join("img/plasma", filename)).convert_alpha()
-            img = pygame.transform.scale(img, (39, 90))
-            if shooter.character_type.startswith("enemy"):
-                img = pygame.transform.flip(img, False, True)
-            self.plasma_images.append(img)
-            
-        # load explosion images
-        for filename in sorted(os.listdir("img/plasmaExplosion")):
-            img = pygame.image.load(os.path.join("img/plasmaExplosion", filename)).convert_alpha()
-            self.explosion_images.append(img)
+        # plasma projectile and explosion images (shared frames from the asset cache)
+        flip = (False, shooter.character_type.startswith("enemy"))
+        self.plasma_images = asset_cache.get_frames("img/plasma", size=(39, 90), flip=flip)
+        self.explosion_images = asset_cache.get_frames("img/plasmaExplosion")
             
         self.image = self.plasma_images[0]
         self.rect = self.image.get_rect(center=shooter.rect.center)
@@ -473,25 +331,23 @@ class Plasma(pygame.sprite.Sprite):
         self.asteroid_group = asteroid_group
         
         
-    def update(self):
+    def update(self, ctx):
         if not self.exploding:
             # move plasma object
             self.rect.y += self.velocity
             
             # Animate plasma object
-            now = pygame.time.get_ticks()
+            now = ctx.now
             if now - self.last_update > self.frame_rate:
                 self.last_update = now
                 self.frame_index = (self.frame_index + 1) % len(self.plasma_images)
                 self.image = self.plasma_images[self.frame_index] # set current image to frame image in list 
                 
             # black hole collision
-            bh_group = getattr(sprite_groups, "blackholes_group", None)
-            if bh_group:
-                for bh in list(bh_group):
-                    if self.rect.colliderect(bh.rect):
-                        self.kill()
-                        return
+            bh_group = ctx.blackholes
+            if bh_group and grid.query(bh_group, self.rect):
+                self.kill()
+                return
                     
                    
             # check for asteroid collision
@@ -504,17 +360,12 @@ class Plasma(pygame.sprite.Sprite):
             )
             
             hit_something = False
-            for target in list(self.target_group):
-                if target is self.shooter:
-                    continue
-                if hasattr(target, "rect") and detection_area.colliderect(target.rect):
+            for target in grid.query(self.target_group, detection_area):
+                if target is not self.shooter:
                     hit_something = True
                     break 
-            if not hit_something:
-                for asteroid in list(self.asteroid_group):
-                    if hasattr(asteroid, "rect") and detection_area.colliderect(asteroid.rect):
-                        hit_something = True
-                        break
+            if not hit_something and grid.query(self.asteroid_group, detection_area):
+                hit_something = True
                     
             if hit_something:
                 self.trigger_explosion()
@@ -527,7 +378,7 @@ class Plasma(pygame.sprite.Sprite):
                 
         else:
             # animate explosion of plasma
-            self.animate_explosion()
+            self.animate_explosion(ctx.now)
             
             
     # method to trigger plasma explosion
@@ -540,8 +391,7 @@ class Plasma(pygame.sprite.Sprite):
         
         
     # animate explosion images and apply damage
-    def animate_explosion(self):   
-        now = pygame.time.get_ticks()
+    def animate_explosion(self, now):
         if not self.damage_applied:                     
             # apply area off effect damage AoE
             explosion_radius = 50 if self.shooter.character_type.startswith("enemy") else 100
@@ -552,18 +402,16 @@ class Plasma(pygame.sprite.Sprite):
                 explosion_radius * 2
             )
 
-            for target in list(self.target_group):
+            for target in grid.query(self.target_group, detection_area):
                 if target is self.shooter:
                     continue
-                if hasattr(target, "rect") and detection_area.colliderect(target.rect):
-                    damage = 5 if self.shooter.character_type.startswith("enemy") else 20
-                    # apply damage using helper function 
-                    apply_damage(target, damage, damage_type="plasma")
+                damage = 5 if self.shooter.character_type.startswith("enemy") else 20
+                # apply damage using helper function 
+                apply_damage(target, damage, damage_type="plasma")
             
-            for asteroid in list(self.asteroid_group):
-                if hasattr(asteroid, "rect") and detection_area.colliderect(asteroid.rect):
-                    asteroid.health -= 20
-                    asteroid.break_apart(self.asteroid_group, rocket_hit=False)
+            for asteroid in grid.query(self.asteroid_group, detection_area):
+                asteroid.health -= 20
+                asteroid.break_apart(self.asteroid_group, rocket_hit=False)
                     
             self.damage_applied = True # Prevents repeated damage
         
@@ -578,15 +426,16 @@ class Plasma(pygame.sprite.Sprite):
                 self.kill()
     
 
-    def draw(self):
-        config.game_window.blit(self.image, self.rect)
-
-
 
 # ____ Ice Bullet ____
 # only targets enemies, ignores asteroids/blackholes/quark stars
-class IceBullet:
+# (pooled, create with IceBullet.acquire and release() once it is no longer active)
+class IceBullet(Pooled):
     def __init__(self, shooter, enemy_group, damage=30, freeze_duration_ms=3000):
+        self.reset(shooter, enemy_group, damage, freeze_duration_ms)
+
+
+    def reset(self, shooter, enemy_group, damage=30, freeze_duration_ms=3000):
         self.shooter = shooter
         self.enemy_group = enemy_group
         self.damage = damage
@@ -601,7 +450,7 @@ class IceBullet:
         # generate random particle positions for visual effect
         for _ in range(4):
             self.particle_offsets.append(
-                pygame.math.Vector2(random.uniform(-4, 4), random.uniform(-4, 4))
+                pygame.math.Vector2(rng.vfx.uniform(-4, 4), rng.vfx.uniform(-4, 4))
             )
         
         self.rect = pygame.Rect(
@@ -612,7 +461,7 @@ class IceBullet:
         )
     
 
-    def update(self):
+    def update(self, ctx):
         if not self.active:
             return
         
@@ -623,18 +472,11 @@ class IceBullet:
         self.rect.centery = int(self.pos.y)
         
         # blackhole / quark star collision check
-        bh_group = getattr(sprite_groups, 'blackholes_group', None)
-        if bh_group:
-            for bh in list(bh_group):
-                try:
-                    if bh.rect.clipline(int(self.prev_pos.x), int(self.prev_pos.y), 
-                                       int(self.pos.x), int(self.pos.y)):
-                        self.active = False
-                        return
-                except Exception:
-                    if bh.rect.colliderect(self.rect):
-                        self.active = False
-                        return
+        bh_group = ctx.blackholes
+        if bh_group and grid.query_line(bh_group, (int(self.prev_pos.x), int(self.prev_pos.y)),
+                                        (int(self.pos.x), int(self.pos.y))):
+            self.active = False
+            return
         
         if self.pos.y < -50 or self.pos.y > config.SCREEN_HEIGHT + 50:
             self.active = False
@@ -645,48 +487,48 @@ class IceBullet:
             return
         
         # check collision with enemies only
-        for enemy in list(self.enemy_group):
-            if not hasattr(enemy, "rect"):
-                continue
-                
-            if self.rect.colliderect(enemy.rect):
-                apply_damage(enemy, self.damage)
+        for enemy in grid.query(self.enemy_group, self.rect):
+            apply_damage(enemy, self.damage)
                 
-                # apply freeze effect
-                if not hasattr(enemy, "frozen_until"):
-                    enemy.frozen_until = 0
+            # apply freeze effect
+            if not hasattr(enemy, "frozen_until"):
+                enemy.frozen_until = 0
                 
-                enemy.frozen_until = pygame.time.get_ticks() + self.freeze_duration_ms
+            enemy.frozen_until = ctx.now + self.freeze_duration_ms
                 
-                self.active = False
-                return
+            self.active = False
+            return
     
 
     def draw(self, surface):
         if not self.active:
             return
         
+        # shape in logical pixels around the bullet, mapped to the play field render scale
+        scale = config.RENDER_SCALE
         x, y = int(self.pos.x), int(self.pos.y)
+        at = lambda dx, dy: (int((x + dx) * scale), int((y + dy) * scale))
+        small = max(1, round(2 * scale))
         
-        tip = (x, y - 10)
-        left = (x - 6, y + 8)
-        right = (x + 6, y + 8)
+        tip = at(0, -10)
+        left = at(-6, 8)
+        right = at(6, 8)
         
         pygame.draw.polygon(surface, (180, 240, 255), [tip, left, right])
         
         # inner lighter triangle for depth
-        inner_tip = (x, y - 8)
-        inner_left = (x - 4, y + 6)
-        inner_right = (x + 4, y + 6)
+        inner_tip = at(0, -8)
+        inner_left = at(-4, 6)
+        inner_right = at(4, 6)
         pygame.draw.polygon(surface, (220, 250, 255), [inner_tip, inner_left, inner_right])
         
         # white outline
-        pygame.draw.polygon(surface, (255, 255, 255), [tip, left, right], 2)
+        pygame.draw.polygon(surface, (255, 255, 255), [tip, left, right], small)
         
         # floating snow particles around the bullet
         for offset in self.particle_offsets:
-            particle_pos = (int(x + offset.x), int(y + offset.y))
-            pygame.draw.circle(surface, (230, 245, 255), particle_pos, 2)
+            particle_pos = at(offset.x, offset.y)
+            pygame.draw.circle(surface, (230, 245, 255), particle_pos, small)
             pygame.draw.circle(surface, (255, 255, 255), particle_pos, 1)
         
-        pygame.draw.circle(surface, (255, 255, 255), (x, y - 6), 2)
\ No newline at end of file
+        pygame.draw.circle(surface, (255, 255, 255), at(0, -6), small)
\ No newline at end of file
@@ -0,0 +1,83 @@
+import weakref
+import pygame # type: ignore
+
+import config
+
+
+# Layered blit queue for the play screen
+#  - sprites submit (surface, dest) pairs to a named layer instead of blitting one by one
+#  - flush(target, layer) draws the whole layer with one Surface.fblits (Surface.blits on older pygame)
+#  - layers are flushed by the play loop in draw order, primitive draws (beams, ice, vfx) run between two flushes
+#  - the number of blits of every layer in the last flush is kept for the profiler and the benchmark
+#  - below render scale 1.0 positions are mapped to internal_surface pixels and images are scaled once per source
+#    surface (weak keys, a sprite's one off image is dropped together with it)
+
+LAYERS = ('black_holes', 'explosions', 'rockets', 'asteroids', 'enemies', 'player_shots', 'projectiles', 'player')
+
+FAST_BLITS = hasattr(pygame.Surface, 'fblits') # pygame 2.4+, skips building the list of dirty rects
+
+_scaled = weakref.WeakKeyDictionary() # source surface -> copy at the render scale
+
+
+def internal_image(surface):
+    """Surface at the play field render scale (the surface itself at 1.0, shared, never draw onto it)"""
+    if config.RENDER_SCALE >= 1.0:
+        return surface
+    scaled = _scaled.get(surface)
+    if scaled is None:
+        w, h = surface.get_size()
+        size = (max(1, round(w * config.RENDER_SCALE)), max(1, round(h * config.RENDER_SCALE)))
+        scaled = _scaled[surface] = pygame.transform.smoothscale(surface, size)
+    return scaled
+
+
+class RenderQueue:
+    def __init__(self):
+        self.layers = {name: [] for name in LAYERS}
+        self.drawn = dict.fromkeys(LAYERS, 0) # blits per layer in the last flush
+
+
+    def submit(self, layer, surface, dest):
+        self.layers[layer].append((surface, dest))
+
+
+    def submit_sprites(self, layer, sprites):
+        """Queue every sprite's current image at its rect"""
+        self.layers[layer].extend((s.image, s.rect) for s in sprites)
+
+
+    def extend(self, layer, items):
+        self.layers[layer].extend(items)
+
+
+    def flush(self, target, layer):
+        """Draw a layer onto the play field target (config.internal_surface)"""
+        items = self.layers[layer]
+        self.drawn[layer] = len(items)
+        if not items:
+            return
+        if config.RENDER_SCALE < 1.0:
+            scale = config.RENDER_SCALE
+            items[:] = [(internal_image(surface), (int(dest[0] * scale), int(dest[1] * scale))) for surface, dest in items]
+        if FAST_BLITS:
+            target.fblits(items)
+        else:
+            target.blits(items, doreturn=False)
+        items.clear()
+
+
+    def clear(self):
+        for items in self.layers.values():
+            items.clear()
+        for layer in self.drawn:
+            self.drawn[layer] = 0
+
+
+    def counts(self):
+        """Blits per layer in the last flush"""
+        return dict(self.drawn)
+
+
+
+# queue shared by the play loop and the projectile manager
+render_queue = RenderQueue()
@@ -0,0 +1,120 @@
+import struct
+from array import array
+
+import config
+
+
+# Input recording and deterministic replay
+#  - a session is fully defined by its seed, level, screen size, start clock and the input state of every simulation step
+#  - the input state is the 10 config flags packed into one bitmask per step
+#  - steps are stored run length encoded (held keys repeat for many steps), an hour of play is a few KB
+#
+# file layout (little endian):
+#   header: magic, version, seed, level, screen width, screen height, clock start, step count
+#   runs:   (run length, mask) pairs, runs longer than 65535 steps are split
+
+INPUT_FLAGS = (
+    'moving_left', 'moving_right', 'moving_up', 'moving_down',
+    'shooting', 'heavy_shooting', 'rocket', 'laserLine_fire', 'plasma_shooting', 'ice_shooting',
+)
+
+MAGIC = b'MREP'
+VERSION = 1
+HEADER = struct.Struct('<4sBIHHHII')
+RUN = struct.Struct('<HH')
+MAX_RUN = 0xFFFF
+
+
+def capture_mask():
+    """Current input flags as a bitmask"""
+    mask = 0
+    for bit, flag in enumerate(INPUT_FLAGS):
+        if getattr(config, flag):
+            mask |= 1 << bit
+    return mask
+
+
+def mask_to_state(mask):
+    return {flag: bool(mask & (1 << bit)) for bit, flag in enumerate(INPUT_FLAGS)}
+
+
+class Recorder:
+    def __init__(self):
+        self.seed = None
+        self.level = None
+        self.clock_start = 0
+        self.masks = array('H')
+
+
+    def begin(self, seed, level, clock_start):
+        self.seed = seed
+        self.level = level
+        self.clock_start = int(clock_start)
+        self.masks = array('H')
+
+
+    @property
+    def steps(self):
+        return len(self.masks)
+
+
+    def record(self):
+        """Store the input state used by the step that is about to run"""
+        self.masks.append(capture_mask())
+
+
+    def save(self, path):
+        runs = []
+        for mask in self.masks:
+            if runs and runs[-1][1] == mask and runs[-1][0] < MAX_RUN:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, mask])
+
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, self.level, config.SCREEN_WIDTH, config.SCREEN_HEIGHT,
+                                self.clock_start, len(self.masks)))
+            for length, mask in runs:
+                f.write(RUN.pack(length, mask))
+
+
+
+class Replay:
+    def __init__(self, seed, level, screen_size, clock_start, masks):
+        self.seed = seed
+        self.level = level
+        self.screen_size = screen_size
+        self.clock_start = clock_start
+        self.masks = masks
+
+
+    @property
+    def steps(self):
+        return len(self.masks)
+
+
+    def input_script(self, step):
+        """start_game input script, the full input state of a recorded step (None after the last one)"""
+        if step >= len(self.masks):
+            return None
+        return mask_to_state(self.masks[step])
+
+
+
+def load(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic, version, seed, level, width, height, clock_start, steps = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a replay file")
+    if version != VERSION:
+        raise ValueError(f"{path} has replay version {version}, expected {VERSION}")
+
+    masks = array('H')
+    for length, mask in RUN.iter_unpack(data[HEADER.size:]):
+        masks.extend([mask] * length)
+    if len(masks) != steps:
+        raise ValueError(f"{path} is truncated ({len(masks)} of {steps} steps)")
+
+    return Replay(seed, level, (width, height), clock_start, masks)
@@ -0,0 +1,27 @@
+import random
+
+
+# Seeded random streams
+#  - gameplay: everything that changes the simulation (spawns, asteroid variants, black hole rolls, enemy jitter)
+#  - vfx: in game particles, stars and comets, kept apart so a visual change never shifts the gameplay sequence
+#  - seed(value) resets both streams, the same seed plus the same inputs replays the same session
+#  - menu effects keep the global random module
+
+gameplay = random.Random()
+vfx = random.Random()
+
+_state = {'seed': None}
+
+
+def seed(value=None):
+    """Seed both streams (a new random seed when value is None) and return the seed used"""
+    if value is None:
+        value = random.SystemRandom().randrange(2 ** 32)
+    gameplay.seed(value)
+    vfx.seed(value ^ 0x5F3759DF) # different sequence, same seed
+    _state['seed'] = value
+    return value
+
+
+def current_seed():
+    return _state['seed']
@@ -0,0 +1,31 @@
+import config
+
+
+# Scrolling level background
+#  - level images are kept opaque in the display pixel format (plain copies, no per pixel alpha)
+#  - the images form a vertical wrap-around strip, the last image is followed by the first again
+#  - a frame is at most two blits: the bottom of the image scrolling in at the top and the top of the image below it
+#  - nothing is allocated per frame, the scroll offset comes from config.scroll_state (advanced by the simulation)
+#  - images are at the play field render size, the logical scroll offset is mapped to it when drawn
+
+class ScrollingBackground:
+    def __init__(self, images):
+        self.images = tuple(img.convert() for img in images)
+        self.width, self.height = self.images[0].get_size() if self.images else (0, 0)
+        self.strip_height = self.height * len(self.images)
+        self.logical_strip_height = config.SCREEN_HEIGHT * len(self.images) # scroll_state is in logical pixels
+
+
+    def draw(self, surface, state):
+        if not self.images:
+            surface.fill(config.BLACK)
+            return
+
+        state['y'] %= self.logical_strip_height # wrap around the strip
+        index, offset = divmod(int(state['y'] * self.height / config.SCREEN_HEIGHT), self.height)
+        images = self.images
+
+        # image i is drawn at y - i * height, so the next image in the strip sits above the current one
+        if offset:
+            surface.blit(images[(index + 1) % len(images)], (0, 0), (0, self.height - offset, self.width, offset))
+        surface.blit(images[index], (0, offset), (0, 0, self.width, self.height - offset))
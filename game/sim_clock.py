@@ -0,0 +1,28 @@
+import config
+
+
+# Simulation clock for the fixed timestep play loop
+#  - gameplay code reads time from here instead of pygame.time.get_ticks()
+#  - time only moves when a simulation step runs, so cooldowns, animations and spawn timers
+#    follow the simulation and not the wall clock (slow render frames no longer slow the game)
+
+STEP_MS = 1000 / config.FPS # one simulation step
+MAX_STEPS_PER_FRAME = 5 # catch up limit, below 12 fps the game slows down instead of spiralling
+LEVEL_START_MS = 60000 # every level starts at the same time (past every initial cooldown) so sessions can be replayed
+
+_clock = {'now': 0.0}
+
+
+def get_ticks():
+    """Simulation time in ms (same meaning as pygame.time.get_ticks)"""
+    return int(_clock['now'])
+
+
+def advance(ms=STEP_MS):
+    _clock['now'] += ms
+
+
+
+
+def set_time(ms):
+    _clock['now'] = float(ms)
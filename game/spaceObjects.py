@@ -1,10 +1,20 @@
 import pygame # type: ignore
-import random, os
 import config
+import sim_clock
+import rng
+import asteroid_variants
+import spawn_budget
+import blackhole_frames
+from object_pool import Pooled
 
-class Asteroid(pygame.sprite.Sprite):
+# asteroids and their fragments are pooled, create with Asteroid.acquire
+class Asteroid(Pooled, pygame.sprite.Sprite):
     def __init__(self, x, y, scale, health=20, is_fragment=False, ice=None, junk=None, fragment_count=1):
         super().__init__()
+        self.reset(x, y, scale, health, is_fragment, ice, junk, fragment_count)
+
+
+    def reset(self, x, y, scale, health=20, is_fragment=False, ice=None, junk=None, fragment_count=1):
         """ - x, y spawn position for object
             - scale: size of multiplier
             - health: damage object can take before breaking
@@ -13,37 +23,30 @@ class Asteroid(pygame.sprite.Sprite):
             - junk: force junk fragments
         """
         self.character_type = "asteroid"
+        self.is_fragment = is_fragment
 
         # load random asteroid image
         # check object types: ice, junk, rock
         if junk is None and not is_fragment:
-            junk = random.randint(1, 3) == 1
+            junk = rng.gameplay.randint(1, 3) == 1
         self.space_junk = junk
         # if ice type chance 
         # ice has a higher chance then junk even with the same (1,3), because code is executed top down so if both are true in same case ice gets created over junk
         if ice is None and not is_fragment:
-            ice = random.randint(1, 3) == 1  
+            ice = rng.gameplay.randint(1, 3) == 1  
         self.ice = ice
         
-        folder = "img/spaceJunk" if self.space_junk else "img/ice" if self.ice else "img/asteroids"
-        files = sorted([f for f in os.listdir(folder) if f.lower().endswith(('.png', '.jpg', '.jpeg'))])
-        
-        if not files:
-            s = pygame.Surface((100, 100). pygame.SRCALPHA)
-            img = s
-        else:
-            img_path = os.path.join(folder, random.choice(files))
-            img = pygame.image.load(img_path).convert_alpha()
-            
-        self.image = pygame.transform.scale(
-            img, (int(img.get_width() * scale), int(img.get_height() * scale))
-        )
+        # pick a variant of the family, surfaces come pre scaled from the variant index
+        self.family = asteroid_variants.family_for(self.ice, self.space_junk)
+        count = asteroid_variants.variant_count(self.family)
+        self.variant = rng.gameplay.randrange(count) if count else 0
+        self.image = asteroid_variants.get_surface(self.family, self.variant, scale)
         self.rect = self.image.get_rect(center=(x, y))
         
         
         # movement
-        self.velocity_y = random.randint(2, 5) # random y speed
-        self.velocity_x = random.choice([-2, -1, 0, 1, 2]) # pick pseudo-random x direction
+        self.velocity_y = rng.gameplay.randint(2, 5) # random y speed
+        self.velocity_x = rng.gameplay.choice([-2, -1, 0, 1, 2]) # pick pseudo-random x direction
         
         # stats
         self.health = health
@@ -56,7 +59,8 @@ class Asteroid(pygame.sprite.Sprite):
         self.damage = int(self.base_damage/ fragment_count)
 
 
-    def update(self, asteroid_group, player):
+    def update(self, ctx):
+        player = ctx.player
         # move asteroid
         self.rect.x += self.velocity_x
         self.rect.y += self.velocity_y
@@ -74,9 +78,10 @@ class Asteroid(pygame.sprite.Sprite):
         
         # check health
         if self.health <= 0:
-            self.break_apart(asteroid_group, rocket_hit=False)
+            self.break_apart(ctx.asteroids, rocket_hit=False)
             # add points to score 
             config.score += 10
+            return # break_apart killed and released this asteroid
 
         # kill object off screen to save memory and computation
         if (self.rect.top > config.SCREEN_HEIGHT or
@@ -105,19 +110,12 @@ class Asteroid(pygame.sprite.Sprite):
             self.kill()
             return
         
-        folder = "img/spaceJunk" if self.space_junk else "img/ice" if self.ice else "img/asteroids"
-        files = sorted([f for f in os.listdir(folder) if f.lower().endswith(('.png', '.jpg', '.jpeg'))])
-        
-        # spawn fragments
-        for _ in range(num_pieces):
-            if files:
-                img_path = os.path.join(folder, random.choice(files))
-            else:
-                img_path = None
+        # spawn fragments (same family, each picks its own variant), as many as the spawn budget allows
+        for _ in range(spawn_budget.grant('fragment', num_pieces)):
             # create new asteroids in random x and y range of 40
-            new_asteroid = Asteroid(
-                self.rect.centerx + random.randint(-20, 20),
-                self.rect.centery + random.randint(-20, 20),
+            new_asteroid = Asteroid.acquire(
+                self.rect.centerx + rng.gameplay.randint(-20, 20),
+                self.rect.centery + rng.gameplay.randint(-20, 20),
                 new_scale,
                 health=new_health,
                 is_fragment=True,
@@ -128,11 +126,6 @@ class Asteroid(pygame.sprite.Sprite):
             asteroid_group.add(new_asteroid)
             
         self.kill()
-        
-        
-    def draw(self, internal_surface):
-        internal_surface.blit(self.image, self.rect)
-
 
 
 # _____ Black hole / quark star ____
@@ -152,10 +145,14 @@ class BlackHole(pygame.sprite.Sprite):
     ASTEROID_ATTRACTION_STRENGTH = 0.005
     
     CENTER_KILL_DISTANCE = 2
+    SPAWN_Y = -50 # 50 px off screen
+    ROTATION_SPEED = 0.15 # degrees per step
+    MIN_FALL_SPEED = 1 # slowest velocity_y roll
+    KILLS_PLAYER = True # benchmark scenarios switch it off so a run always lasts its full length
     MIN_SCALE = 0.05
     ASTEROID_SCALE = 0.95
     
-    def __init__(self, x=None, y=None, initial_size=160, rotation_speed=0.15, frame_rate_ms=100):
+    def __init__(self, x=None, y=None, initial_size=blackhole_frames.DEFAULT_SIZE, rotation_speed=ROTATION_SPEED, frame_rate_ms=100):
         super().__init__()
         
         self.last_break_time = 0 # track cooldown
@@ -163,32 +160,14 @@ class BlackHole(pygame.sprite.Sprite):
         
         # quark neutron star
         self.quark_star = False
-        self.quark_chance = random.randint(1, 3) # 3 times less chance than blackhole
+        self.quark_chance = rng.gameplay.randint(1, 3) # 3 times less chance than blackhole
         if self.quark_chance == 1:
             self.quark_star = True
             
-        # load frames from folder
-        self.frames = []
-        folder = "img/quarkstar" if self.quark_star else "img/blackhole" 
-        if os.path.isdir(folder):
-            files = sorted([f for f in os.listdir(folder) if f.lower().endswith(('.png', '.jpg', '.jpeg'))])
-            for f in files:
-                try:
-                    img = pygame.image.load(os.path.join(folder, f)).convert_alpha()
-                    img = pygame.transform.scale(img, (initial_size, initial_size))
-                    self.frames.append(img)
-                except Exception:
-                    pass
-                
-        if not self.frames: # if no image load one image as default
-            try:
-                img = pygame.image.load("img/blackhole/0.png").convert_alpha() # load basic static image
-                img = pygame.transform.scale(img, (initial_size, initial_size))
-                self.frames = [img]
-            except Exception:
-                # if still no image 0 first one in blackhole folder we create blank alpha
-                blank_alpha = pygame.Surface((initial_size , initial_size), pygame.SRCALPHA)
-                self.frames = [blank_alpha]
+        # frames and their rotations are shared by every black hole of the same kind
+        self.kind = 'quarkstar' if self.quark_star else 'blackhole'
+        self.size = initial_size
+        self.frames = blackhole_frames.get_frames(self.kind, initial_size)
                 
         
         # animation state
@@ -197,24 +176,24 @@ class BlackHole(pygame.sprite.Sprite):
             self.frame_rate_ms = 20 # quark star has a faster animation for spin effect
         else:
             self.frame_rate_ms = frame_rate_ms
-        self.last_frame_time = pygame.time.get_ticks() # keep track of time for animation
+        self.last_frame_time = sim_clock.get_ticks() # keep track of time for animation
         
         # start with base frame
         self.base_frame = self.frames[self.frame_index]
-        self.image = self.base_frame.copy() # create a copy of original image
+        self.image = self.base_frame
         self.rect = self.image.get_rect()
         
         # spawn off top of the screen by defualt
         if x is None:
-            x = random.randint(50, config.SCREEN_WIDTH - 50)
+            x = rng.gameplay.randint(50, config.SCREEN_WIDTH - 50)
         if y is None:
-            y = -50 # 50 px off screen
+            y = self.SPAWN_Y
         self.rect.center = (x,y)
         self.bh_pos = pygame.math.Vector2(self.rect.center)
         
         # movement : mimic the same effect as asteroid drift
-        self.velocity_y = float(random.randint(1,4))
-        self.velocity_x = float(random.choice([-2, -1, 0, 1, 2]))
+        self.velocity_y = float(rng.gameplay.randint(self.MIN_FALL_SPEED, 4))
+        self.velocity_x = float(rng.gameplay.choice([-2, -1, 0, 1, 2]))
         # rotation
         self.angle = 0.0
         self.rotation_speed = rotation_speed
@@ -222,30 +201,34 @@ class BlackHole(pygame.sprite.Sprite):
         self.center = pygame.math.Vector2(self.rect.center)
 
 
-    def advance_frame(self):
-        now = pygame.time.get_ticks()
+    @classmethod
+    def visible_angle(cls, fall_speed=MIN_FALL_SPEED, size=blackhole_frames.DEFAULT_SIZE):
+        """Largest angle a spawned black hole turns through before it has fallen below the screen"""
+        steps = (config.SCREEN_HEIGHT - cls.SPAWN_Y + size) / fall_speed # the rotated image is never taller than 1.42 * size
+        return min(360.0, steps * cls.ROTATION_SPEED)
+
+
+    def advance_frame(self, now):
         if now - self.last_frame_time >= self.frame_rate_ms:
             self.last_frame_time = now
             self.frame_index = (self.frame_index + 1) % len(self.frames)
             self.base_frame = self.frames[self.frame_index]
             
     
-    def update(self, groups_map=None):
+    def update(self, ctx):
         # animate frames
-        self.advance_frame()
+        self.advance_frame(ctx.now)
         
-        # rotate chosen frame and preserve center
+        # rotated frame from the shared table (quantized angle), the rect is resized in place
         self.angle = (self.angle + self.rotation_speed) % 360 # full circle
-        old_center = self.rect.center
-        rotated = pygame.transform.rotate(self.base_frame, self.angle)
-        self.image = rotated
-        self.rect = self.image.get_rect(center=old_center)
+        self.image = blackhole_frames.get_rotated(self.kind, self.size, self.frame_index, self.angle)
+        self.rect.size = self.image.get_size()
         
         # move down and drift using those float positions
         self.bh_pos.x += self.velocity_x
         self.bh_pos.y += self.velocity_y
         self.rect.center = (int(self.bh_pos.x), int(self.bh_pos.y))
-        self.center = (pygame.math.Vector2(self.rect.center))
+        self.center.update(self.rect.center)
         
         # kill object if it is off screen
         if (self.rect.top > config.SCREEN_HEIGHT * 1.3 or
@@ -258,18 +241,11 @@ class BlackHole(pygame.sprite.Sprite):
                 print("Could not kill heavy mass star")
             return
 
-        # apply attraction to groups if provided
-        if groups_map:
-            player = groups_map.get('player')
-            if player:
-                self.apply_to_sprite(player)
-            
-            
-            for key in ('enemy_group', 'asteroids', 'player_lasers', 'enemy_lasers', 'rockets_group'):
-                group = groups_map.get(key)
-                if group:
-                    for spr in list(group):
-                        self.apply_to_sprite(spr)
+        # apply attraction to the player and the gravity groups of this step
+        self.apply_to_sprite(ctx.player)
+        for group in ctx.gravity_groups:
+            for spr in list(group):
+                self.apply_to_sprite(spr)
                         
                         
     def in_attraction_range(self, sprite):
@@ -315,6 +291,8 @@ class BlackHole(pygame.sprite.Sprite):
         # create fall in kill zone
         if distance <= self.CENTER_KILL_DISTANCE:
             if getattr(sprite, 'character_type', None) == 'player':
+                if not self.KILLS_PLAYER:
+                    return
                 # instantly kill player when sucked into blackhole
                 sprite.health = 0
                 sprite.alive = False
@@ -356,12 +334,14 @@ class BlackHole(pygame.sprite.Sprite):
             target_h = max(2, int(current_h * shrink_factor))
             if target_w < current_w or target_h < current_h:
                 old_center = sprite.rect.center
-                sprite.image = pygame.transform.smoothscale(base_img, (target_w, target_h))
-                sprite.rect = sprite.image.get_rect(center=old_center)
+                if hasattr(sprite, 'warp'):
+                    # characters reset their image in update, the warp is applied when they are drawn (frame_image)
+                    sprite.warp = (sim_clock.get_ticks(), (target_w, target_h))
+                    sprite.rect = pygame.Rect(0, 0, target_w, target_h)
+                    sprite.rect.center = old_center
+                else:
+                    sprite.image = pygame.transform.smoothscale(base_img, (target_w, target_h))
+                    sprite.rect = sprite.image.get_rect(center=old_center)
                 
         except Exception:
             pass
-        
-         
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
\ No newline at end of file
@@ -0,0 +1,107 @@
+import pygame # type: ignore
+
+from entity_registry import registry
+
+
+# Uniform spatial hash for collision queries
+#  - every sprite group is inserted once per simulation step (rebuild), sprites added during the step are inserted on add
+#  - a query returns the sprites of one group whose rect collides with the query rect
+#  - results are in group order and use each sprite's current rect, so hits are identical to looping
+#    over the group with colliderect (only the candidates are fewer)
+
+CELL_SIZE = 128
+QUERY_MARGIN = 32 # covers how far a sprite can move in one step after it was inserted
+
+
+class SpatialHash:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {} # group -> {(cell_x, cell_y): [(order, sprite), ...]}
+        self.order = 0
+
+
+    def clear(self):
+        self.cells = {}
+        self.order = 0
+
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+
+    def insert(self, group, sprite):
+        cells = self.cells.get(group)
+        rect = getattr(sprite, 'rect', None) # laser lines have no sprite rect
+        if cells is None or rect is None:
+            return
+        self.order += 1
+        entry = (self.order, sprite)
+        x0, y0, x1, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+
+    def rebuild(self, groups):
+        """Clear the grid and insert every sprite of the given groups"""
+        self.clear()
+        for group in groups:
+            self.cells[group] = {}
+            for sprite in group:
+                self.insert(group, sprite)
+
+
+    def query(self, group, rect):
+        """Sprites of group colliding with rect, in group order"""
+        cells = self.cells.get(group)
+        if cells is None: # group not in the grid (e.g. a one off Group([player])) so scan it
+            return [sprite for sprite in group if rect.colliderect(sprite.rect)]
+
+        x0, y0, x1, y1 = self._cell_range(rect.inflate(QUERY_MARGIN * 2, QUERY_MARGIN * 2))
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for order, sprite in bucket:
+                        if order > found.get(sprite, 0): # a pooled sprite re-added mid step has a newer entry
+                            found[sprite] = order
+
+        hits = [(order, sprite) for sprite, order in found.items()
+                if sprite in group and rect.colliderect(sprite.rect)]
+        hits.sort(key=lambda hit: hit[0])
+        return [sprite for _, sprite in hits]
+
+
+    def query_line(self, group, start, end):
+        """Sprites of group whose rect is crossed by the segment start -> end, in group order"""
+        x0, y0 = start
+        x1, y1 = end
+        bounds = pygame.Rect(min(x0, x1), min(y0, y1), abs(x1 - x0) + 1, abs(y1 - y0) + 1)
+        cells = self.cells.get(group)
+        candidates = group if cells is None else self.query(group, bounds.inflate(2, 2))
+        return [sprite for sprite in candidates if sprite.rect.clipline(x0, y0, x1, y1)]
+
+
+
+# grid shared by the play loop
+grid = SpatialHash()
+
+
+class IndexedGroup(pygame.sprite.Group):
+    """Sprite group that also inserts sprites added mid step into the shared grid and keeps the entity registry current"""
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        grid.insert(self, sprite)
+        registry.add(self, sprite)
+
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        registry.remove(self, sprite)
@@ -0,0 +1,75 @@
+# Entity spawn budget
+#  - every spawn site asks for a slot in its category before it creates anything
+#  - each category has its own cap and all categories share one total budget
+#  - lower priority categories stop spawning earlier as the total fills up, so cosmetic asteroid
+#    fragments are dropped first and combat enemies last
+#  - limits are entity counts and not measured time, so a replay spawns exactly the same entities
+
+CATEGORIES = ('fragment', 'asteroid', 'blackhole', 'fighter', 'enemy') # low to high priority
+
+CAPS = {
+    'fragment': 48,
+    'asteroid': 24,
+    'blackhole': 3,
+    'fighter': 12,
+    'enemy': 40,
+}
+
+TOTAL_BUDGET = 100
+
+# share of the total budget a category may still spawn into
+LOAD_LIMITS = {
+    'fragment': 0.6,
+    'asteroid': 0.75,
+    'blackhole': 0.9,
+    'fighter': 0.9,
+    'enemy': 1.0,
+}
+
+_counts = {category: 0 for category in CATEGORIES}
+_denied = {category: 0 for category in CATEGORIES}
+_state = {'total': 0}
+
+
+def _category(sprite):
+    if getattr(sprite, 'character_type', None) == 'asteroid':
+        return 'fragment' if sprite.is_fragment else 'asteroid'
+    return 'fighter' if getattr(sprite, 'character_type', None) == 'enemy9' else 'enemy'
+
+
+def begin_step(enemy_group, asteroid_group, blackholes_group):
+    """Recount the live entities (once per simulation step, before anything spawns)"""
+    for category in CATEGORIES:
+        _counts[category] = 0
+    for group in (enemy_group, asteroid_group):
+        for sprite in group:
+            _counts[_category(sprite)] += 1
+    _counts['blackhole'] = len(blackholes_group)
+    _state['total'] = sum(_counts.values())
+
+
+def grant(category, requested=1):
+    """Number of the requested spawns that fit the budget (each granted one is counted)"""
+    room = min(CAPS[category] - _counts[category],
+               int(TOTAL_BUDGET * LOAD_LIMITS[category]) - _state['total'])
+    granted = max(0, min(requested, room))
+    _counts[category] += granted
+    _state['total'] += granted
+    _denied[category] += requested - granted
+    return granted
+
+
+def allow(category):
+    return grant(category) == 1
+
+
+def stats():
+    return {category: {'live': _counts[category], 'cap': CAPS[category], 'denied': _denied[category]}
+            for category in CATEGORIES}
+
+
+def reset():
+    for category in CATEGORIES:
+        _counts[category] = 0
+        _denied[category] = 0
+    _state['total'] = 0
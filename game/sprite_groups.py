@@ -1,15 +1,22 @@
 import pygame # type: ignore
 
+from spatial_hash import IndexedGroup, grid
+
 
 #sprite Groups
 
-enemy_group = pygame.sprite.Group()
-player_lasers = pygame.sprite.Group()
-enemy_lasers = pygame.sprite.Group()
-heavyLaser_group = pygame.sprite.Group()
-rockets_group = pygame.sprite.Group()
-asteroid_group = pygame.sprite.Group()
-enemy_beam_group = pygame.sprite.Group()
-explosion_group = pygame.sprite.Group()
-blackholes_group = pygame.sprite.Group()
-plasma_group = pygame.sprite.Group()
\ No newline at end of file
+enemy_group = IndexedGroup()
+rockets_group = IndexedGroup()
+asteroid_group = IndexedGroup()
+enemy_beam_group = IndexedGroup()
+explosion_group = IndexedGroup()
+blackholes_group = IndexedGroup()
+plasma_group = IndexedGroup()
+
+all_groups = (enemy_group, rockets_group, asteroid_group, enemy_beam_group, explosion_group, blackholes_group, plasma_group)
+group_names = ('enemy_group', 'rockets_group', 'asteroid_group', 'enemy_beam_group', 'explosion_group', 'blackholes_group', 'plasma_group')
+
+
+# insert every group into the collision grid (once per simulation step)
+def rebuild_spatial_index():
+    grid.rebuild(all_groups)
@@ -1,6 +1,7 @@
 import pygame
 import math
-import random
+import rng
+import config
 
 # Colors
 COMET_COLOR = (255, 255, 255)
@@ -34,12 +35,15 @@ class Particle:
 
     def draw(self, surface):
         if self.alpha > 0:
-            s = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
+            # sizes and position in play field render pixels
+            scale = config.RENDER_SCALE
+            size = self.size * scale
+            s = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
             grad_alpha = int(self.alpha * 0.8)
-            pygame.draw.circle(s, (*self.color, int(grad_alpha * 0.2)), (int(self.size * 2), int(self.size * 2)), int(self.size * 2))
-            pygame.draw.circle(s, (*self.color, int(grad_alpha * 0.5)), (int(self.size * 2), int(self.size * 2)), int(self.size * 1.2))
-            pygame.draw.circle(s, (*self.color, grad_alpha), (int(self.size * 2), int(self.size * 2)), int(self.size))
-            surface.blit(s, (self.x - self.size * 2, self.y - self.size * 2))
+            pygame.draw.circle(s, (*self.color, int(grad_alpha * 0.2)), (int(size * 2), int(size * 2)), int(size * 2))
+            pygame.draw.circle(s, (*self.color, int(grad_alpha * 0.5)), (int(size * 2), int(size * 2)), int(size * 1.2))
+            pygame.draw.circle(s, (*self.color, grad_alpha), (int(size * 2), int(size * 2)), int(size))
+            surface.blit(s, (self.x * scale - size * 2, self.y * scale - size * 2))
 
 
 class Comet:
@@ -52,28 +56,28 @@ class Comet:
 
     def reset(self):
         # Spawn randomly off-screen along the top or left side
-        side = random.choice(['top', 'left'])
+        side = rng.vfx.choice(['top', 'left'])
         
         if side == 'top':
             # Spawn above the screen, random X
-            self.x = random.randint(-50, self.screen_width + 50)
-            self.y = random.randint(-100, -20) # Spawn a bit further up
+            self.x = rng.vfx.randint(-50, self.screen_width + 50)
+            self.y = rng.vfx.randint(-100, -20) # Spawn a bit further up
         else:
             # Spawn left of the screen, random Y
-            self.x = random.randint(-100, -20) # Spawn a bit further left
-            self.y = random.randint(-50, self.screen_height + 50) # Allow spawning from various Y positions
+            self.x = rng.vfx.randint(-100, -20) # Spawn a bit further left
+            self.y = rng.vfx.randint(-50, self.screen_height + 50) # Allow spawning from various Y positions
             
         # Add slight random deviation to the angle
-        angle_dev = random.uniform(30, 60) # Range from slightly less to slightly more diagonal
+        angle_dev = rng.vfx.uniform(30, 60) # Range from slightly less to slightly more diagonal
         self.angle = math.radians(angle_dev)
         
         # Adjust base speed. Comets should feel faster than the background scroll
-        self.base_speed = random.uniform(5, 10) 
-        self.size = random.randint(3, 7)
+        self.base_speed = rng.vfx.uniform(5, 10) 
+        self.size = rng.vfx.randint(3, 7)
         self.trail = []
         self.timer = 0
         
-        self.spawn_delay = random.randint(30, 120) 
+        self.spawn_delay = rng.vfx.randint(30, 120) 
 
     def update(self, scroll_speed):
         """Updates position, incorporating the background scroll speed to make it relative."""
@@ -94,11 +98,11 @@ class Comet:
             for _ in range(2): 
                 self.trail.append(Particle(
                     self.x, self.y,
-                    random.uniform(math.radians(200), math.radians(250)), # A range of upward-backward angles
-                    random.uniform(0.5, 1.4),
-                    random.randint(2, self.size + 1),
-                    random.randint(25, 45),
-                    random.choice(TAIL_COLORS)
+                    rng.vfx.uniform(math.radians(200), math.radians(250)), # A range of upward-backward angles
+                    rng.vfx.uniform(0.5, 1.4),
+                    rng.vfx.randint(2, self.size + 1),
+                    rng.vfx.randint(25, 45),
+                    rng.vfx.choice(TAIL_COLORS)
                 ))
 
         # Update particles, keeping only the alive ones
@@ -119,5 +123,7 @@ class Comet:
             p.draw(surface)
 
         # Simple soft head 
-        pygame.draw.circle(surface, COMET_COLOR, (int(self.x), int(self.y)), self.size)
-        pygame.draw.circle(surface, (255, 255, 210), (int(self.x), int(self.y)), int(self.size * 0.6))
\ No newline at end of file
+        scale = config.RENDER_SCALE
+        head = (int(self.x * scale), int(self.y * scale))
+        pygame.draw.circle(surface, COMET_COLOR, head, max(1, round(self.size * scale)))
+        pygame.draw.circle(surface, (255, 255, 210), head, int(self.size * 0.6 * scale))
\ No newline at end of file
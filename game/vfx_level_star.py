@@ -1,5 +1,5 @@
 import pygame
-import random
+import rng
 import config 
 
 class FastStarVFX:
@@ -51,13 +51,13 @@ class FastStarVFX:
             for _ in range(count):
                 speed_range = speed_max - speed_min
                 all_stars.append({
-                    'x': random.randint(0, self.width),
-                    'y': random.randint(0, self.height),
-                    'size': random.randint(1, size_max),
+                    'x': rng.vfx.randint(0, self.width),
+                    'y': rng.vfx.randint(0, self.height),
+                    'size': rng.vfx.randint(1, size_max),
                     # Calculate speed within the layer's range
-                    'speed': speed_min + random.random() * speed_range,
+                    'speed': speed_min + rng.vfx.random() * speed_range,
                     'color': color,
-                    'flicker_timer': random.randint(0, 120), 
+                    'flicker_timer': rng.vfx.randint(0, 120), 
                     'is_visible': True,
                     'layer': layer_type # Identify the layer for resetting
                 })
@@ -71,10 +71,10 @@ class FastStarVFX:
         speed_range = speed_max - speed_min
         
         star['y'] = -star['size'] # Reset above the screen
-        star['x'] = random.randint(0, self.width)
-        star['size'] = random.randint(1, size_max)
-        star['speed'] = speed_min + random.random() * speed_range
-        star['flicker_timer'] = random.randint(0, 120)
+        star['x'] = rng.vfx.randint(0, self.width)
+        star['size'] = rng.vfx.randint(1, size_max)
+        star['speed'] = speed_min + rng.vfx.random() * speed_range
+        star['flicker_timer'] = rng.vfx.randint(0, 120)
         star['is_visible'] = True 
 
     def update(self):
@@ -86,28 +86,30 @@ class FastStarVFX:
             star['flicker_timer'] -= 1
             if star['flicker_timer'] <= 0:
                 star['is_visible'] = not star['is_visible']
-                star['flicker_timer'] = random.randint(10, 120)
+                star['flicker_timer'] = rng.vfx.randint(10, 120)
             
             # Reset stars that scroll off the bottom
             if star['y'] > self.height:
                 self._reset_star(star)
 
     def draw(self, surface):
-        """Draws the visible stars, using lines for the fast 'Near' stars."""
+        """Draws the visible stars, using lines for the fast 'Near' stars (surface is the play field, render scale applies)."""
+        scale = config.RENDER_SCALE
         for star in self.stars:
             if star['is_visible']:
                 color = star['color']
-                center_x = int(star['x'])
-                center_y = int(star['y'])
+                center_x = int(star['x'] * scale)
+                center_y = int(star['y'] * scale)
+                size = max(1, round(star['size'] * scale))
                 
                 if star['layer'] == 'near':
-                    streak_length = int(star['speed'] * 0.8) 
+                    streak_length = int(star['speed'] * 0.8 * scale) 
                     
                     start_point = (center_x, center_y)
                     end_point = (center_x, center_y + streak_length)
                     
-                    pygame.draw.line(surface, color, start_point, end_point, star['size'])
+                    pygame.draw.line(surface, color, start_point, end_point, size)
 
                 else: # 'far' layer remains a single circle
                     # Draw as a dim, twinkling point
-                    pygame.draw.circle(surface, color, (center_x, center_y), star['size'])
\ No newline at end of file
+                    pygame.draw.circle(surface, color, (center_x, center_y), size)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import pygame
-import random
+import rng
 import math
 import config
 
@@ -7,17 +7,17 @@ class ThrusterParticle(pygame.sprite.Sprite):
     def __init__(self, x, y, color, speed_y_offset):
         super().__init__()
         self.color = color
-        self.size = random.randint(1, 5)
+        self.size = rng.vfx.randint(1, 5)
         self.lifetime = 30 # frames
         self.age = 0
-        self.speed = random.uniform(1.0, 3.0) # Speed away from the ship
+        self.speed = rng.vfx.uniform(1.0, 3.0) # Speed away from the ship
         
         # Calculate angle for spread
-        angle = math.radians(random.uniform(80, 100))
+        angle = math.radians(rng.vfx.uniform(80, 100))
         
         # Calculate velocity components
-        self.vel_x = random.uniform(-2.5, 2.5) 
-        self.vel_y = random.uniform(2.0, 4.0) + speed_y_offset 
+        self.vel_x = rng.vfx.uniform(-2.5, 2.5) 
+        self.vel_y = rng.vfx.uniform(2.0, 4.0) + speed_y_offset 
         
         # Create image as a simple glow circle
         self.image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
@@ -59,8 +59,8 @@ class ThrusterVFX:
             {'offset_x': 15, 'offset_y': 45, 'side': 1}    # Right thruster
         ]
 
-    def update(self, is_moving, scroll_speed):
-        now = pygame.time.get_ticks()
+    def update(self, is_moving, scroll_speed, now):
+        # now is simulation time, so the spawn count (and the vfx random stream) does not depend on the frame rate
         
         # Only spawn if the player is actively moving AND it's time for the next particle
         if is_moving and now - self.last_spawn_time > self.spawn_interval:
@@ -85,7 +85,7 @@ class ThrusterVFX:
             thruster_x = base_x + offset_x
             thruster_y = base_y + offset_y
             
-            color_choice = random.choice([
+            color_choice = rng.vfx.choice([
                 (255, 100, 0),    # Bright Orange-Red
                 (255, 60, 0),     # More fiery Red
                 (255, 140, 0),    # Darker Orange
@@ -98,9 +98,17 @@ class ThrusterVFX:
             
             # Override vel_x to ensure outward spread from each thruster
             # Small random range, but biased by the side_modifier
-            particle.vel_x = random.uniform(1.0, 3.0) * side_modifier + random.uniform(-0.5, 0.5) 
+            particle.vel_x = rng.vfx.uniform(1.0, 3.0) * side_modifier + rng.vfx.uniform(-0.5, 0.5) 
             
             self.particles.add(particle)
 
     def draw(self, surface):
-        self.particles.draw(surface)
\ No newline at end of file
+        # particles move in logical pixels, surface is the play field (render scale applies)
+        scale = config.RENDER_SCALE
+        if scale >= 1.0:
+            self.particles.draw(surface)
+            return
+        for p in self.particles: # images are redrawn every update, so they are scaled when drawn
+            w, h = p.image.get_size()
+            image = pygame.transform.scale(p.image, (max(1, round(w * scale)), max(1, round(h * scale))))
+            surface.blit(image, (int(p.rect.x * scale), int(p.rect.y * scale)))
\ No newline at end of file